@@ -0,0 +1,64 @@
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+
+from arena.parallel import play_game_tasks, resolve_workers
+from arena.stats import RunningStats
+
+
+def marginal_gain(stats, planned):
+    # Drop in the variance of the matchup's mean score from one more game: s^2/n - s^2/(n+1).
+    # Every matchup feeds the score_stats CI of both its strategies with the same weight,
+    # so ranking by this also ranks by the reduction in leaderboard uncertainty.
+    n = stats.n + planned
+    return stats.variance() / (n * (n + 1))
+
+
+def plan_round(matchup_stats, round_size):
+    """Greedily hands out round_size games, each to the matchup with the largest marginal gain."""
+    planned = [0] * len(matchup_stats)
+    heap = [(-marginal_gain(stats, 0), index) for index, stats in enumerate(matchup_stats)]
+    heapq.heapify(heap)
+    for _ in range(round_size):
+        gain, index = heapq.heappop(heap)
+        if gain == 0:
+            break
+        planned[index] += 1
+        heapq.heappush(heap, (-marginal_gain(matchup_stats[index], planned[index]), index))
+    return planned
+
+
+def allocate_games(engine, pairs, game_budget, pilot_games, workers=1):
+    """Plays pilot_games per matchup, then spends the rest of game_budget where score variance is highest.
+
+    Returns the per-game results of every matchup, in pair order. Matchups whose pilot
+    games all scored the same (e.g. two deterministic strategies) get no further games.
+    """
+    pilot_games = max(2, min(pilot_games, game_budget // max(len(pairs), 1)))
+    matchup_games = [[] for _ in pairs]
+    matchup_stats = [RunningStats() for _ in pairs]
+
+    def play(planned, pool):
+        indexes = [index for index, n in enumerate(planned) if n]
+        tasks = [(*pairs[index], planned[index], len(matchup_games[index])) for index in indexes]
+        for index, games in zip(indexes, play_game_tasks(engine, tasks, pool)):
+            for game in games:
+                matchup_games[index].append(game)
+                matchup_stats[index].add(game[2], game[0])
+        return sum(planned)
+
+    pool = ProcessPoolExecutor(max_workers=resolve_workers(workers)) if resolve_workers(workers) > 1 else None
+    try:
+        remaining = game_budget - play([pilot_games] * len(pairs), pool)
+        # Re-plan in rounds so variance estimates keep improving as games come in
+        round_size = max(len(pairs), game_budget // 10)
+        while remaining > 0:
+            planned = plan_round(matchup_stats, min(round_size, remaining))
+            played = play(planned, pool)
+            if not played:
+                break
+            remaining -= played
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return matchup_games
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+from concurrent.futures import as_completed
+
+from arena.game_engine import GameEngine
+from arena.moves import OUTCOME
+from arena.remote import LocalPlayer, RemoteStrategy
+from arena.rng import ROUTER, game_seeds
+from arena.sandbox import StrategyForfeit
+
+
+class AsyncGameEngine(GameEngine):
+    """GameEngine whose games run as asyncio tasks, for strategies that live behind a socket.
+
+    Any strategy may be a RemoteStrategy (see arena.remote); local strategy classes
+    play through the same awaitable interface. Every game of every pending matchup is
+    in flight at once, up to MAX_GAMES_IN_FLIGHT, so network round trips overlap
+    instead of adding up. The event loop runs on a background thread, which keeps
+    the synchronous tournament API (round robin, Swiss, checkpoints, events) as it is.
+    A remote bot that fails, or takes longer than REMOTE_TIMEOUT seconds to answer,
+    forfeits the game as a sandboxed strategy would. Remote bots have no source to
+    fingerprint, so their matchups are always played, never served from CACHE_DIR.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.MAX_GAMES_IN_FLIGHT = self.conf.get("max_games_in_flight", 256)
+        self.REMOTE_TIMEOUT = self.conf.get("remote_timeout", 5.0)
+        self._loop = None
+        self._slots = None
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["_loop"] = state["_slots"] = None
+        return state
+
+    def _submit(self, coroutine):
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, name="async-engine", daemon=True).start()
+            self._slots = asyncio.run_coroutine_threadsafe(self._make_slots(), self._loop).result()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    async def _make_slots(self):
+        return asyncio.Semaphore(self.MAX_GAMES_IN_FLIGHT)
+
+    def close(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+
+    def cacheable(self, strategy1_class, strategy2_class):
+        return not any(isinstance(cls, RemoteStrategy) for cls in (strategy1_class, strategy2_class))
+
+    async def open_player(self, strategy_class, game_id, seed, seat=0):
+        if isinstance(strategy_class, RemoteStrategy):
+            return await strategy_class.connect(game_id, seed, seat, self.REMOTE_TIMEOUT or None)
+        return LocalPlayer(strategy_class, seed if self.SEED is not None else None)
+
+    async def play_single_game_async(self, strategy1_class, strategy2_class, game_index=0):
+        async with self._slots:
+            seed1, seed2 = game_seeds(self.SEED, strategy1_class.name, strategy2_class.name, game_index)
+            game_id = f"{strategy1_class.name}/{strategy2_class.name}/{game_index}"
+            # Both sides always run to completion, so a failing one never leaves the other mid-request
+            opened = await asyncio.gather(
+                self.open_player(strategy1_class, game_id + "/0", seed1, 0),
+                self.open_player(strategy2_class, game_id + "/1", seed2, 1),
+                return_exceptions=True
+            )
+            moves1, moves2 = (bytearray(), bytearray()) if self.observers else (None, None)
+            try:
+                s1, s2 = _raise_first(opened)
+                outcome = OUTCOME
+                counts = [0, 0, 0]
+                for _ in range(self.NUM_PLAYS_PER_GAME):
+                    move1, move2 = _raise_first(await asyncio.gather(s1.play(), s2.play(), return_exceptions=True))
+                    counts[outcome[move1][move2]] += 1
+                    if moves1 is not None:
+                        moves1.append(move1)
+                        moves2.append(move2)
+                    s1.handle_moves(move1, move2)
+                    s2.handle_moves(move2, move1)
+            except StrategyForfeit as forfeit:
+                counts = self.forfeit_counts(forfeit.seat)
+            finally:
+                ROUTER.release()
+                await asyncio.gather(*(player.close() for player in opened if not isinstance(player, BaseException)))
+        if moves1 is not None:
+            self.notify_observers(strategy1_class.name, strategy2_class.name, game_index, moves1, moves2)
+
+        draws, wins1, wins2 = counts
+        return self.score_game(wins1, wins2, draws)
+
+    async def play_games_async(self, strategy1_class, strategy2_class, num_games, first_game=0):
+        return await asyncio.gather(*(
+            self.play_single_game_async(strategy1_class, strategy2_class, game_index)
+            for game_index in range(first_game, first_game + num_games)
+        ))
+
+    def play_distinct_games(self, strategy1_class, strategy2_class, num_games, first_game=0):
+        return self._submit(self.play_games_async(strategy1_class, strategy2_class, num_games, first_game)).result()
+
+    def play_matchups(self, pairs, workers=None):
+        """Yields (index, totals) for each pair as it finishes, with the games of all pairs in flight together."""
+        if self.EARLY_STOP_TOLERANCE:
+            # Early stopping decides game by game, so matchups go one at a time
+            yield from super().play_matchups(pairs, workers=1)
+            return
+        futures = {
+            self._submit(self.play_games_async(s1_cls, s2_cls, self.NUM_GAMES_PER_MATCH)): index
+            for index, (s1_cls, s2_cls) in enumerate(pairs)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            games = future.result()
+            self.report_games(pairs[index][0].name, pairs[index][1].name, games)
+            yield index, self.tally_games(games)
+
+
+def _raise_first(results):
+    # asyncio.gather(..., return_exceptions=True) results, with the first seat's failure taking precedence
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
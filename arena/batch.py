@@ -0,0 +1,86 @@
+import numpy as np
+
+from arena.moves import OUTCOME, PAYOFF, ROCK, PAPER, SCISSORS
+from arena.rng import ROUTER, RoutedPlayer, game_streams
+from arena.specs import StrategySpec
+
+OUTCOME_TABLE = np.array(OUTCOME, dtype=np.int8)
+PAYOFF_TABLE = np.array(PAYOFF, dtype=np.int8)
+COUNTER_TABLE = np.array([1, 2, 0], dtype=np.int8)
+# rng.choice(MOVE_CODES) consumes a stream exactly like random.choice(["rock", "paper", "scissors"])
+MOVE_CODES = (ROCK, PAPER, SCISSORS)
+
+
+class InstanceBatch:
+    """Fallback for strategies without a batch_class: one instance per game, driven in a loop."""
+
+    def __init__(self, strategy_factory, rngs):
+        self.players = [RoutedPlayer(strategy_factory, rng) for rng in rngs]
+        self._plays = [p.play for p in self.players]
+        self._handles = [p.handle_moves for p in self.players]
+
+    def play_batch(self):
+        return np.fromiter((play() for play in self._plays), dtype=np.int8, count=len(self._plays))
+
+    def handle_moves_batch(self, own_moves, opponent_moves):
+        for handle, own, opp in zip(self._handles, own_moves.tolist(), opponent_moves.tolist()):
+            handle(own, opp)
+
+
+def make_batch(strategy_factory, rngs):
+    """Builds the struct-of-arrays state for len(rngs) independent games of one strategy.
+
+    Strategy classes opt in by pointing `batch_class` at a class taking (rngs, **kwargs)
+    that implements play_batch() and handle_moves_batch(own_moves, opponent_moves) on
+    int8 move arrays. rngs holds one random.Random stream per game; a batch class must
+    draw from them exactly as the scalar strategy draws from `random`, so batched and
+    scalar runs of the same seed agree. Everything else falls back to InstanceBatch.
+    """
+    if isinstance(strategy_factory, StrategySpec):
+        strategy_class, kwargs = strategy_factory.load(), strategy_factory.kwargs
+    else:
+        strategy_class, kwargs = strategy_factory, {}
+
+    batch_class = getattr(strategy_class, "batch_class", None)
+    if batch_class is None:
+        return InstanceBatch(strategy_factory, rngs)
+    return batch_class(rngs, **kwargs)
+
+
+def play_games_batched(engine, strategy1_class, strategy2_class, num_games, first_game=0):
+    """Advances num_games independent games of one matchup in lockstep, one round per step."""
+    streams = [
+        game_streams(engine.SEED, strategy1_class.name, strategy2_class.name, game_index)
+        for game_index in range(first_game, first_game + num_games)
+    ]
+    b1 = make_batch(strategy1_class, [rng1 for rng1, _ in streams])
+    b2 = make_batch(strategy2_class, [rng2 for _, rng2 in streams])
+    play1, play2 = b1.play_batch, b2.play_batch
+    handle1, handle2 = b1.handle_moves_batch, b2.handle_moves_batch
+
+    counts = np.zeros((num_games, 3), dtype=np.int64)
+    games = np.arange(num_games)
+    if engine.observers:
+        # One row of moves per game, handed to the observers once all games are done
+        trace1 = np.empty((num_games, engine.NUM_PLAYS_PER_GAME), dtype=np.uint8)
+        trace2 = np.empty_like(trace1)
+        for round_index in range(engine.NUM_PLAYS_PER_GAME):
+            moves1 = play1()
+            moves2 = play2()
+            counts[games, OUTCOME_TABLE[moves1, moves2]] += 1
+            trace1[:, round_index] = moves1
+            trace2[:, round_index] = moves2
+            handle1(moves1, moves2)
+            handle2(moves2, moves1)
+        for game, game_index in enumerate(range(first_game, first_game + num_games)):
+            engine.notify_observers(strategy1_class.name, strategy2_class.name, game_index, trace1[game], trace2[game])
+    else:
+        for _ in range(engine.NUM_PLAYS_PER_GAME):
+            moves1 = play1()
+            moves2 = play2()
+            counts[games, OUTCOME_TABLE[moves1, moves2]] += 1
+            handle1(moves1, moves2)
+            handle2(moves2, moves1)
+    ROUTER.release()
+
+    return [engine.score_game(int(w1), int(w2), int(d)) for d, w1, w2 in counts]
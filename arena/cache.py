@@ -0,0 +1,124 @@
+import hashlib
+import json
+import os
+import sys
+import types
+
+from arena.specs import StrategySpec
+from arena.storage import write_json
+
+# Engine modules whose code decides how a game plays out; editing any of them invalidates the cache
+ENGINE_MODULES = (
+    "arena.game_engine", "arena.moves", "arena.batch", "arena.rng",
+    "arena.markov", "arena.history", "arena.timing", "arena.sandbox"
+)
+
+_source_hashes = {}
+
+
+def _module_source(module_name):
+    module = sys.modules[module_name]
+    path = getattr(module, "__file__", None)
+    if not path or not os.path.exists(path):
+        return b""
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def _local_imports(module_name, package):
+    """Modules of the same top-level package that module_name pulls names from (e.g. its sub-strategies)."""
+    found = set()
+    for value in vars(sys.modules[module_name]).values():
+        if isinstance(value, types.ModuleType):
+            name = value.__name__
+        elif isinstance(value, (type, types.FunctionType)):
+            name = value.__module__
+        else:
+            continue
+        if name in sys.modules and name.split(".")[0] == package:
+            found.add(name)
+    return found
+
+
+def source_hash(module_name, transitive=True):
+    """sha256 over the source of a module and, transitively, every module of its package it imports."""
+    if (module_name, transitive) in _source_hashes:
+        return _source_hashes[module_name, transitive]
+    package = module_name.split(".")[0]
+    seen, pending = set(), [module_name]
+    while pending:
+        name = pending.pop()
+        if name not in seen:
+            seen.add(name)
+            if transitive:
+                pending.extend(_local_imports(name, package) - seen)
+
+    digest = hashlib.sha256()
+    for name in sorted(seen):
+        digest.update(name.encode() + b"\0" + _module_source(name) + b"\0")
+    _source_hashes[module_name, transitive] = digest.hexdigest()
+    return _source_hashes[module_name, transitive]
+
+
+def strategy_fingerprint(strategy_class):
+    spec = StrategySpec.from_class(strategy_class)
+    return {
+        "name": strategy_class.name,
+        "class": f"{spec.module}.{spec.qualname}",
+        "kwargs": repr(sorted(spec.kwargs.items())),
+        "source": source_hash(spec.load().__module__)
+    }
+
+
+def engine_fingerprint(engine):
+    return {
+        "num_plays_per_game": engine.NUM_PLAYS_PER_GAME,
+        "num_games_per_match": engine.NUM_GAMES_PER_MATCH,
+        "no_point_threshold": engine.NO_POINT_THRESHOLD,
+        "max_score": engine.MAX_SCORE,
+        "early_stop_tolerance": engine.EARLY_STOP_TOLERANCE,
+        "early_stop_min_games": engine.EARLY_STOP_MIN_GAMES,
+        "seed": engine.SEED,
+        "deterministic_check_games": engine.DETERMINISTIC_CHECK_GAMES,
+        "exact_markov_games": engine.EXACT_MARKOV_GAMES,
+        "move_time_budget": engine.MOVE_TIME_BUDGET,
+        "move_watchdog_timeout": engine.MOVE_WATCHDOG_TIMEOUT,
+        "penalty_move": engine.PENALTY_MOVE,
+        "sandbox_timeout": engine.SANDBOX_TIMEOUT if engine.SANDBOX_STRATEGIES else None,
+        "history_limit": engine.HISTORY_LIMIT,
+        "engine_source": [source_hash(name, transitive=False) for name in ENGINE_MODULES if name in sys.modules]
+    }
+
+
+class MatchupCache:
+    """On-disk store of matchup totals keyed by strategy source, engine config and seed.
+
+    Each entry is a small JSON file named after its key, written atomically, so the
+    directory can sit on shared storage and be filled by several machines at once.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, engine, strategy1_class, strategy2_class):
+        payload = {
+            "engine": engine_fingerprint(engine),
+            "strategies": [strategy_fingerprint(strategy1_class), strategy_fingerprint(strategy2_class)]
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), "r") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        totals = entry["totals"]
+        return {name: tuple(value) if isinstance(value, list) else value for name, value in totals.items()}
+
+    def put(self, key, totals, strategies=None):
+        write_json(self._path(key), {"strategies": strategies, "totals": totals})
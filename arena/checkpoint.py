@@ -0,0 +1,77 @@
+import json
+import os
+
+from arena.cache import engine_fingerprint
+from arena.stats import TournamentStats, tournament_results
+
+
+def _as_result(entry):
+    return {name: tuple(value) if isinstance(value, list) else value for name, value in entry.items()}
+
+
+def read_checkpoint(path):
+    """Returns (header, matchup results) of a checkpoint file; a half-written last line is ignored."""
+    header, results = None, []
+    try:
+        with open(path, "r") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if "engine" in entry:
+                    header = entry
+                else:
+                    results.append(_as_result(entry["result"]))
+    except OSError:
+        pass
+    return header, results
+
+
+def partial_results(path, games_per_match):
+    """Tournament results over the matchups checkpointed so far; safe to call while the run is going."""
+    _, results = read_checkpoint(path)
+    stats = TournamentStats(games_per_match)
+    for result in results:
+        stats.add(result)
+    return tournament_results(stats, results)
+
+
+class TournamentCheckpoint:
+    """Append-only journal of finished matchups, one JSON line each.
+
+    The first line records the engine fingerprint; a resumed run only reuses the
+    journal when it was written under the same settings, otherwise it starts over.
+    Every line is flushed and fsynced as soon as its matchup finishes, so a crash
+    loses at most the matchups that were in flight. The per-strategy accumulators
+    are rebuilt from the journal rather than stored, which keeps them exact.
+    """
+
+    def __init__(self, path, engine, resume=True):
+        self.path = path
+        header = {"engine": engine_fingerprint(engine)}
+        saved_header, saved = read_checkpoint(path) if resume else (None, [])
+        self.results = saved if saved_header == header else []
+        # Rewrite what is kept, so a torn last line never runs into the next record
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as file:
+            file.write(json.dumps(header) + "\n")
+            for result in self.results:
+                file.write(json.dumps({"result": result}) + "\n")
+        os.replace(tmp_path, path)
+        self.done = {result["strategies"] for result in self.results}
+
+    def previous(self):
+        return {"metrics": self.results}
+
+    def record(self, result):
+        if result["strategies"] in self.done:
+            return
+        self.done.add(result["strategies"])
+        self.results.append(result)
+        with open(self.path, "a") as file:
+            file.write(json.dumps({"result": result}) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
@@ -0,0 +1,57 @@
+import json
+import os
+import statistics
+
+from arena.storage import write_json
+
+# Floor for a learned cost, so predictions never reach zero
+MIN_COST = 1e-9
+
+
+class CostModel:
+    """Persisted per-strategy estimate of the seconds one game costs, learned from past timings.
+
+    A matchup is predicted to cost the sum of its two strategies' costs per game.
+    Each observed matchup moves both estimates towards the measurement, splitting
+    the error in proportion to their current share, so a heavy strategy soaks up
+    most of it. Strategies never timed are estimated at the median of the known costs.
+    """
+
+    def __init__(self, path=None, learning_rate=0.5):
+        self.path = path
+        self.learning_rate = learning_rate
+        self.costs = {}
+        if path and os.path.exists(path):
+            with open(path, "r") as file:
+                self.costs = json.load(file)
+
+    def strategy_cost(self, name):
+        if name in self.costs:
+            return self.costs[name]
+        return statistics.median(self.costs.values()) if self.costs else 1.0
+
+    def game_cost(self, name1, name2):
+        return self.strategy_cost(name1) + self.strategy_cost(name2)
+
+    def observe(self, name1, name2, seconds, num_games):
+        if num_games <= 0:
+            return
+        per_game = seconds / num_games
+        new = {name1, name2} - self.costs.keys()
+        if new:
+            # First sighting: the new strategies take whatever the known one does not explain
+            known = sum(self.costs[name] for name in {name1, name2} - new)
+            for name in new:
+                self.costs[name] = max((per_game - known) / (2 if name1 == name2 else len(new)), MIN_COST)
+            return
+        cost1, cost2 = self.costs[name1], self.costs[name2]
+        predicted = cost1 + cost2
+        error = self.learning_rate * (per_game - predicted)
+        self.costs[name1] = max(cost1 + error * cost1 / predicted, MIN_COST)
+        if name2 != name1:
+            self.costs[name2] = max(cost2 + error * cost2 / predicted, MIN_COST)
+
+    def save(self):
+        if not self.path:
+            return
+        write_json(self.path, self.costs, indent=2, sort_keys=True)
@@ -0,0 +1,112 @@
+import json
+import queue
+import threading
+
+MATCH_STARTED = "match_started"
+GAME_FINISHED = "game_finished"
+MATCH_FINISHED = "match_finished"
+TOURNAMENT_FINISHED = "tournament_finished"
+
+
+class Reporter:
+    """Sink for tournament events. handle() runs on the EventBus writer thread, never on the engine's."""
+
+    def handle(self, event, payload):
+        pass
+
+    def close(self):
+        pass
+
+
+class SilentReporter(Reporter):
+    pass
+
+
+class ConsoleReporter(Reporter):
+    """Prints each finished matchup the way round_robin_tournament always has."""
+
+    def __init__(self, games_per_match=None):
+        self.games_per_match = games_per_match
+
+    def handle(self, event, payload):
+        if event != MATCH_FINISHED:
+            return
+        name1, name2 = payload["strategies"]
+        total_wins1, total_wins2 = payload["wins"]
+        winrate1, winrate2 = payload["winrates"]
+        avg_score1, avg_score2 = payload["scores"]
+        avg_norm1, avg_norm2 = payload["normalized"]
+
+        print(f"\n--- Match: {name1} vs {name2} ---")
+        print(f"Wins: {total_wins1} / {total_wins2} | Draws: {payload['draws']}")
+        print(f"Winrates: {winrate1:.2%} / {winrate2:.2%}")
+        print(f"Averaged Score: {avg_score1:.2f} / {avg_score2:.2f}")
+        print(f"Normalized Proportion: {avg_norm1:.2f} / {avg_norm2:.2f}")
+        if self.games_per_match and payload["games"] != self.games_per_match:
+            print(f"Games Played: {payload['games']} / {self.games_per_match}")
+        violations1, violations2 = payload.get("violations", (0, 0))
+        if violations1 or violations2:
+            print(f"Move Budget Violations: {violations1} / {violations2}")
+
+
+class NDJSONReporter(Reporter):
+    """Appends every event as one JSON line: {"event": ..., **payload}."""
+
+    def __init__(self, path):
+        self.file = open(path, "a")
+
+    def handle(self, event, payload):
+        self.file.write(json.dumps({"event": event, **payload}) + "\n")
+
+    def close(self):
+        self.file.close()
+
+
+class QueueReporter(Reporter):
+    """Hands (event, payload) pairs to another thread, e.g. a dashboard polling self.queue."""
+
+    def __init__(self, maxsize=0):
+        self.queue = queue.Queue(maxsize)
+
+    def handle(self, event, payload):
+        self.queue.put((event, payload))
+
+
+class EventBus:
+    """Fans events out to reporters from a background writer thread.
+
+    emit() only enqueues, so slow sinks (terminal, disk) never stall the engine;
+    close() drains the queue and closes every reporter. With no reporters there
+    is no thread and emit() returns straight away.
+    """
+
+    _STOP = object()
+
+    def __init__(self, reporters=()):
+        self.reporters = list(reporters)
+        self.queue = None
+        self.thread = None
+        if self.reporters:
+            self.queue = queue.SimpleQueue()
+            self.thread = threading.Thread(target=self._run, name="event-writer", daemon=True)
+            self.thread.start()
+
+    def emit(self, event, **payload):
+        if self.thread is not None:
+            self.queue.put((event, payload))
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is self._STOP:
+                return
+            for reporter in self.reporters:
+                reporter.handle(*item)
+
+    def close(self):
+        if self.thread is not None:
+            self.queue.put(self._STOP)
+            self.thread.join()
+            self.thread = None
+        for reporter in self.reporters:
+            reporter.close()
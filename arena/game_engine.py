@@ -1,8 +1,27 @@
 import importlib
 import math
-from collections import defaultdict
+from contextlib import contextmanager
 from config_loader import load_config
-from statistics import mean, variance
+from arena.allocation import allocate_games
+from arena.cache import MatchupCache
+from arena.checkpoint import TournamentCheckpoint
+from arena.costs import CostModel
+from arena.events import (
+    GAME_FINISHED, MATCH_FINISHED, MATCH_STARTED, TOURNAMENT_FINISHED,
+    ConsoleReporter, EventBus, NDJSONReporter, Reporter
+)
+from arena.batch import play_games_batched
+from arena.markov import expected_counts, has_markov_model
+from arena.moves import MOVE_INDEX, OUTCOME, as_int_strategy
+from arena.pairing import rank_diagnostics, sampled_pairs, swiss_pairs
+from arena.rng import ROUTER, RoutedPlayer, game_seeds, game_streams
+from arena.sandbox import Sandbox, StrategyForfeit
+from arena.parallel import play_matchups_parallel, resolve_workers
+from arena.ratings import GlickoRatings, RatingReporter
+from arena.specs import strategy_attribute
+from arena.stats import RunningStats, TournamentStats, tournament_results
+from arena.timing import TimedPlayer
+from arena.traces import TraceRecorder
 
 class GameEngine:
     def __init__(self):
@@ -11,44 +30,183 @@ class GameEngine:
         self.NUM_GAMES_PER_MATCH = self.conf["num_games_per_match"]
         self.NO_POINT_THRESHOLD = self.conf["no_point_threshold"]
         self.MAX_SCORE = self.conf["max_score"]
+        self.NUM_WORKERS = self.conf.get("num_workers", 1)
+        self.GAMES_PER_TASK = self.conf.get("games_per_task", 0)
+        self.BATCHED_GAMES = self.conf.get("batched_games", False)
+        self.EARLY_STOP_TOLERANCE = self.conf.get("early_stop_tolerance", 0.0)
+        self.EARLY_STOP_MIN_GAMES = max(2, self.conf.get("early_stop_min_games", 10))
+        self.GAME_BUDGET = self.conf.get("game_budget", 0)
+        self.PILOT_GAMES = self.conf.get("pilot_games", 10)
+        self.SEED = self.conf.get("seed")
+        self.CACHE_DIR = self.conf.get("cache_dir")
+        self.CHECKPOINT_PATH = self.conf.get("checkpoint_path")
+        self.RESUME = self.conf.get("resume", True)
+        self.REPORTER = self.conf.get("reporter", "console")
+        self.EVENTS_PATH = self.conf.get("events_path")
+        self.COST_MODEL_PATH = self.conf.get("cost_model_path")
+        self.LEASE_SECONDS = self.conf.get("lease_seconds", 600)
+        self.SWISS_ROUNDS = self.conf.get("swiss_rounds", 0)
+        self.SAMPLED_OPPONENTS = self.conf.get("sampled_opponents", 10)
+        self.RATINGS_PATH = self.conf.get("ratings_path")
+        self.DETERMINISTIC_CHECK_GAMES = self.conf.get("deterministic_check_games", 0)
+        self.FAST_FORWARD_CYCLES = self.conf.get("fast_forward_cycles", True)
+        self.EXACT_MARKOV_GAMES = self.conf.get("exact_markov_games", False)
+        self.MOVE_TIME_BUDGET = self.conf.get("move_time_budget", 0.0)
+        self.MOVE_WATCHDOG_TIMEOUT = self.conf.get("move_watchdog_timeout", 0.0)
+        self.PENALTY_MOVE = self.conf.get("penalty_move", "rock")
+        self.SANDBOX_STRATEGIES = self.conf.get("sandbox_strategies", False)
+        self.SANDBOX_TIMEOUT = self.conf.get("sandbox_timeout", 1.0)
+        self.HISTORY_LIMIT = self.conf.get("history_limit")
+        self.TRACE_DIR = self.conf.get("trace_dir")
+        self.TRACE_COMPRESSION = self.conf.get("trace_compression")
+        self.events = EventBus()
+        self.observers = [TraceRecorder(self.TRACE_DIR, self.TRACE_COMPRESSION)] if self.TRACE_DIR else []
+
+    def add_observer(self, observer):
+        """Registers a RoundObserver (see arena.observers); games are then played round by round, never shortcut."""
+        self.observers.append(observer)
+
+    def remove_observer(self, observer):
+        self.observers.remove(observer)
+
+    def notify_observers(self, strategy1_name, strategy2_name, game_index, moves1, moves2):
+        for observer in self.observers:
+            observer.on_game(strategy1_name, strategy2_name, game_index, moves1, moves2)
+
+    def __getstate__(self):
+        # Worker processes get a quiet engine; the event bus and its thread stay here
+        state = self.__dict__.copy()
+        state["events"] = EventBus()
+        return state
 
     def play_single_round(self, strategy1, strategy2):
+        # Both strategies speak the integer move protocol (see arena.moves.as_int_strategy)
         move1 = strategy1.play()
         move2 = strategy2.play()
-
-        if move1 == move2:
-            result = 0
-        elif (
-            (move1 == "rock" and move2 == "scissors") or
-            (move1 == "scissors" and move2 == "paper") or
-            (move1 == "paper" and move2 == "rock")
-        ):
-            result = 1
-        else:
-            result = 2
-
+        result = OUTCOME[move1][move2]
         strategy1.handle_moves(move1, move2)
         strategy2.handle_moves(move2, move1)
         return result
 
-    def play_single_game(self, strategy1_class, strategy2_class):
-        s1 = strategy1_class()
-        s2 = strategy2_class()
+    def play_single_game(self, strategy1_class, strategy2_class, game_index=0, sandboxes=None):
+        if sandboxes is not None:
+            # Sandboxed processes seed their own `random` exactly as the in-process streams are seeded
+            seed1, seed2 = game_seeds(self.SEED, strategy1_class.name, strategy2_class.name, game_index)
+            s1, s2 = sandboxes[0].new_game(seed1), sandboxes[1].new_game(seed2)
+        elif self.SEED is None:
+            s1 = as_int_strategy(strategy1_class())
+            s2 = as_int_strategy(strategy2_class())
+        else:
+            # Each player draws from its own stream, keyed by seed, matchup and game index
+            rng1, rng2 = game_streams(self.SEED, strategy1_class.name, strategy2_class.name, game_index)
+            s1 = RoutedPlayer(strategy1_class, rng1)
+            s2 = RoutedPlayer(strategy2_class, rng2)
 
-        wins1, wins2, draws = 0, 0, 0
-        for _ in range(self.NUM_PLAYS_PER_GAME):
-            result = self.play_single_round(s1, s2)
-            if result == 1:
-                wins1 += 1
-            elif result == 2:
-                wins2 += 1
+        if self.MOVE_TIME_BUDGET:
+            penalty = MOVE_INDEX[self.PENALTY_MOVE]
+            s1 = TimedPlayer(s1, self.MOVE_TIME_BUDGET, penalty, self.MOVE_WATCHDOG_TIMEOUT)
+            s2 = TimedPlayer(s2, self.MOVE_TIME_BUDGET, penalty, self.MOVE_WATCHDOG_TIMEOUT)
+
+        moves = None
+        try:
+            if self.observers:
+                moves = bytearray(), bytearray()
+                counts = self.play_rounds_recorded(s1, s2, *moves)
+            elif self.FAST_FORWARD_CYCLES and hasattr(s1, "state_key") and hasattr(s2, "state_key"):
+                counts = self.play_rounds_fast_forward(s1, s2)
             else:
-                draws += 1
+                play1, play2 = s1.play, s2.play
+                handle1, handle2 = s1.handle_moves, s2.handle_moves
+                outcome = OUTCOME
+                counts = [0, 0, 0]
+                for _ in range(self.NUM_PLAYS_PER_GAME):
+                    move1 = play1()
+                    move2 = play2()
+                    counts[outcome[move1][move2]] += 1
+                    handle1(move1, move2)
+                    handle2(move2, move1)
+        except StrategyForfeit as forfeit:
+            sandboxes[forfeit.seat].forfeited()
+            counts = self.forfeit_counts(forfeit.seat)
+        ROUTER.release()
+        if moves is not None:
+            self.notify_observers(strategy1_class.name, strategy2_class.name, game_index, *moves)
 
+        draws, wins1, wins2 = counts
+        violations = (s1.violations, s2.violations) if self.MOVE_TIME_BUDGET else (0, 0)
+        return self.score_game(wins1, wins2, draws, violations)
+
+    def forfeit_counts(self, seat):
+        """(draws, wins1, wins2) of a game forfeited by `seat`: the forfeiting side loses every round."""
+        if seat == 0:
+            return [0, 0, self.NUM_PLAYS_PER_GAME]
+        return [0, self.NUM_PLAYS_PER_GAME, 0]
+
+    def play_rounds_recorded(self, strategy1, strategy2, moves1, moves2):
+        # The observed twin of the plain round loop: moves go into two bytearrays, no per-round callbacks
+        play1, play2 = strategy1.play, strategy2.play
+        handle1, handle2 = strategy1.handle_moves, strategy2.handle_moves
+        record1, record2 = moves1.append, moves2.append
+        outcome = OUTCOME
+        counts = [0, 0, 0]
+        for _ in range(self.NUM_PLAYS_PER_GAME):
+            move1 = play1()
+            move2 = play2()
+            counts[outcome[move1][move2]] += 1
+            record1(move1)
+            record2(move2)
+            handle1(move1, move2)
+            handle2(move2, move1)
+        return counts
+
+    def play_rounds_fast_forward(self, strategy1, strategy2):
+        """Plays rounds until the joint state repeats, then extrapolates the rest of the game.
+
+        Both strategies expose state_key(): a hashable that, together with the moves still
+        to come, fixes all of their future play, or None while their next move may still
+        be random. Once the pair of keys repeats, the game is periodic from there on, so
+        the outcome counts of the remaining rounds follow from one period. In long-game
+        mode (HISTORY_LIMIT set) the search starts afresh every HISTORY_LIMIT rounds, so
+        memory stays bounded and cycles up to half that length are still found.
+        """
+        play1, play2 = strategy1.play, strategy2.play
+        handle1, handle2 = strategy1.handle_moves, strategy2.handle_moves
+        key1, key2 = strategy1.state_key, strategy2.state_key
+        outcome = OUTCOME
+        num_rounds = self.NUM_PLAYS_PER_GAME
+        counts = [0, 0, 0]
+        window = self.HISTORY_LIMIT or num_rounds
+        base = 0  # first round of the current search window
+        history = []  # history[r - base] = counts before round r
+        seen = {}
+        for round_index in range(num_rounds):
+            if round_index - base == window:
+                base = round_index
+                history.clear()
+                seen.clear()
+            history.append(tuple(counts))
+            state = (key1(), key2())
+            if state[0] is not None and state[1] is not None:
+                start = seen.setdefault(state, round_index)
+                if start != round_index:
+                    period = round_index - start
+                    full_periods, rest = divmod(num_rounds - round_index, period)
+                    for code in range(3):
+                        per_period = counts[code] - history[start - base][code]
+                        counts[code] += full_periods * per_period + history[start - base + rest][code] - history[start - base][code]
+                    return counts
+            move1 = play1()
+            move2 = play2()
+            counts[outcome[move1][move2]] += 1
+            handle1(move1, move2)
+            handle2(move2, move1)
+        return counts
+
+    def score_game(self, wins1, wins2, draws, violations=(0, 0)):
         norm1, norm2 = self.compute_normalized_proportions(wins1, wins2)
         score1 = norm1 * self.MAX_SCORE
         score2 = norm2 * self.MAX_SCORE
-        return norm1, norm2, score1, score2, wins1, wins2, draws
+        return norm1, norm2, score1, score2, wins1, wins2, draws, violations
 
     def compute_normalized_proportions(self, wins1, wins2):
         total = wins1 + wins2
@@ -61,113 +219,398 @@ class GameEngine:
         norm2 = prop2 / 0.5
         return norm1, norm2
 
-    def round_robin_tournament(self, strategy_classes):
-        total_scores = defaultdict(float)
-        score_records = defaultdict(list)
-        normalized_records = defaultdict(list)
-        games_played = defaultdict(int)
-        matchups = []
-        detailed_stats = []
-        matchup_results = defaultdict(list)
-
-        for i in range(len(strategy_classes)):
-            for j in range(i + 1, len(strategy_classes)):
-                s1_cls = strategy_classes[i]
-                s2_cls = strategy_classes[j]
-                s1 = s1_cls()
-                s2 = s2_cls()
-
-                sum_norm1, sum_norm2 = 0.0, 0.0
-                sum_score1, sum_score2 = 0.0, 0.0
-                total_wins1, total_wins2, total_draws = 0, 0, 0
-
-                for _ in range(self.NUM_GAMES_PER_MATCH):
-                    norm1, norm2, score1, score2, wins1, wins2, draws = self.play_single_game(s1_cls, s2_cls)
-                    sum_norm1 += norm1
-                    sum_norm2 += norm2
-                    sum_score1 += score1
-                    sum_score2 += score2
-                    total_wins1 += wins1
-                    total_wins2 += wins2
-                    total_draws += draws
-
-                avg_score1 = sum_score1 / self.NUM_GAMES_PER_MATCH
-                avg_score2 = sum_score2 / self.NUM_GAMES_PER_MATCH
-                avg_norm1 = sum_norm1 / self.NUM_GAMES_PER_MATCH
-                avg_norm2 = sum_norm2 / self.NUM_GAMES_PER_MATCH
-
-                total_scores[s1_cls.name] += avg_score1
-                total_scores[s2_cls.name] += avg_score2
-                score_records[s1_cls.name].append(avg_score1)
-                score_records[s2_cls.name].append(avg_score2)
-                normalized_records[s1_cls.name].append(avg_norm1)
-                normalized_records[s2_cls.name].append(avg_norm2)
-                games_played[s1_cls.name] += 1
-                games_played[s2_cls.name] += 1
-
-                matchup_results[s1_cls.name].append(avg_score1)
-                matchup_results[s2_cls.name].append(avg_score2)
-
-                decisive_rounds = total_wins1 + total_wins2 or 1
-
-                print(f"\n--- Match: {s1_cls.name} vs {s2_cls.name} ---")
-                print(f"Wins: {total_wins1} / {total_wins2} | Draws: {total_draws}")
-                print(f"Winrates: {total_wins1 / decisive_rounds:.2%} / {total_wins2 / decisive_rounds:.2%}")
-                print(f"Averaged Score: {avg_score1:.2f} / {avg_score2:.2f}")
-                print(f"Normalized Proportion: {avg_norm1:.2f} / {avg_norm2:.2f}")
-
-                matchups.append((s1_cls.name, s2_cls.name, avg_score1, avg_score2))
-
-                detailed_stats.append({
-                    "strategies": (s1_cls.name, s2_cls.name),
-                    "wins": (total_wins1, total_wins2),
-                    "draws": total_draws,
-                    "winrates": (
-                        total_wins1 / decisive_rounds,
-                        total_wins2 / decisive_rounds
-                    ),
-                    "scores": (avg_score1, avg_score2),
-                    "normalized": (avg_norm1, avg_norm2)
-                })
-
-        final_avg_scores = {
-            name: total_scores[name] / games_played[name] if games_played[name] else 0.0
-            for name in total_scores
+    def play_games(self, strategy1_class, strategy2_class, num_games, first_game=0):
+        """Per-game results of games first_game .. first_game + num_games - 1 of a matchup.
+
+        Two strategies that declare `deterministic = True` play the same game every
+        time, so it is played once and repeated. With DETERMINISTIC_CHECK_GAMES set,
+        any matchup whose first that many games all came out identical is treated the
+        same way; that check is a heuristic and can be fooled by rarely-random strategies.
+        With EXACT_MARKOV_GAMES, pairs of strategies that declare a Markov model (see
+        arena.markov) are not played at all: every game gets the exact expected counts.
+        Under a MOVE_TIME_BUDGET, games are never memoized, as timings differ per game,
+        and with observers registered every game is played so that they see its rounds.
+        With SANDBOX_STRATEGIES every game is played in the sandboxes too: the shortcuts
+        would load and run strategy code in this process, and a crash or hang there
+        must forfeit the game it happens in.
+        """
+        if self.observers or self.SANDBOX_STRATEGIES:
+            return self.play_distinct_games(strategy1_class, strategy2_class, num_games, first_game)
+
+        if self.EXACT_MARKOV_GAMES and has_markov_model(strategy1_class) and has_markov_model(strategy2_class):
+            return [self.expected_game(strategy1_class, strategy2_class)] * num_games
+
+        if self.MOVE_TIME_BUDGET:
+            return self.play_distinct_games(strategy1_class, strategy2_class, num_games, first_game)
+
+        if num_games > 1 and all(strategy_attribute(cls, "deterministic", False) for cls in (strategy1_class, strategy2_class)):
+            return self.play_distinct_games(strategy1_class, strategy2_class, 1, first_game) * num_games
+
+        check = max(2, self.DETERMINISTIC_CHECK_GAMES) if self.DETERMINISTIC_CHECK_GAMES else 0
+        if check and num_games > check:
+            head = self.play_distinct_games(strategy1_class, strategy2_class, check, first_game)
+            if all(game == head[0] for game in head):
+                return head + [head[0]] * (num_games - check)
+            return head + self.play_distinct_games(strategy1_class, strategy2_class, num_games - check, first_game + check)
+        return self.play_distinct_games(strategy1_class, strategy2_class, num_games, first_game)
+
+    def expected_game(self, strategy1_class, strategy2_class):
+        # Scored from the expected counts, which is the mean game score only to first order.
+        # The counts stay fractional here; tally_games rounds the matchup totals once
+        draws, wins1, wins2 = expected_counts(strategy1_class(), strategy2_class(), self.NUM_PLAYS_PER_GAME)
+        return self.score_game(wins1, wins2, draws)
+
+    def play_distinct_games(self, strategy1_class, strategy2_class, num_games, first_game=0):
+        if self.SANDBOX_STRATEGIES:
+            return self.play_sandboxed_games(strategy1_class, strategy2_class, num_games, first_game)
+        # Move budgets are enforced per call, which only the scalar path does
+        if self.BATCHED_GAMES and not self.MOVE_TIME_BUDGET:
+            return play_games_batched(self, strategy1_class, strategy2_class, num_games, first_game)
+        return [
+            self.play_single_game(strategy1_class, strategy2_class, game_index)
+            for game_index in range(first_game, first_game + num_games)
+        ]
+
+    def play_sandboxed_games(self, strategy1_class, strategy2_class, num_games, first_game=0):
+        """Plays games with each strategy in its own process (see arena.sandbox); one process per seat for all games."""
+        sandboxes = []
+        try:
+            for seat, strategy_class in enumerate((strategy1_class, strategy2_class)):
+                sandboxes.append(Sandbox(strategy_class, seat, self.SANDBOX_TIMEOUT))
+            return [
+                self.play_single_game(strategy1_class, strategy2_class, game_index, sandboxes)
+                for game_index in range(first_game, first_game + num_games)
+            ]
+        finally:
+            for sandbox in sandboxes:
+                sandbox.close()
+
+    def tally_games(self, game_results):
+        # Sums per-game results in order, so any chunking of a matchup reduces to the same totals
+        sum_norm1, sum_norm2 = 0.0, 0.0
+        sum_score1, sum_score2 = 0.0, 0.0
+        total_wins1, total_wins2, total_draws = 0, 0, 0
+        total_violations1, total_violations2 = 0, 0
+        num_games = 0
+
+        for norm1, norm2, score1, score2, wins1, wins2, draws, (violations1, violations2) in game_results:
+            sum_norm1 += norm1
+            sum_norm2 += norm2
+            sum_score1 += score1
+            sum_score2 += score2
+            total_wins1 += wins1
+            total_wins2 += wins2
+            total_draws += draws
+            total_violations1 += violations1
+            total_violations2 += violations2
+            num_games += 1
+
+        # Exact Markov games carry fractional expected counts: they are summed as they are and
+        # rounded once here, draws taking what the rounded wins leave of the total rounds
+        wins1, wins2 = round(total_wins1), round(total_wins2)
+        draws = round(total_wins1 + total_wins2 + total_draws) - wins1 - wins2
+        return {
+            "games": num_games,
+            "wins": (wins1, wins2),
+            "draws": draws,
+            "sum_norm": (sum_norm1, sum_norm2),
+            "sum_score": (sum_score1, sum_score2),
+            "violations": (total_violations1, total_violations2)
         }
 
-        score_stats = {}
-        for name in score_records:
-            scores = score_records[name]
-            norms = normalized_records[name]
-            n = len(scores)
-            avg = final_avg_scores[name]
-            var = variance(scores) if n > 1 else 0.0
-            std_dev = math.sqrt(var)
-            std_error = std_dev / math.sqrt(n) if n > 1 else 0.0
-            margin = 1.96 * std_error
-            ci_low = avg - margin
-            ci_high = avg + margin
-            worst_score = min(scores) if scores else 0.0
-            win_ratio = sum(1 for s in scores if s > 0) / n if n else 0.0
-            dominance_index = sum(1 for s in scores if s > 10) / n if n else 0.0
-
-            score_stats[name] = {
-                "average": avg,
-                "total": sum(scores) * self.NUM_GAMES_PER_MATCH,
-                "variance": var,
-                "std_dev": std_dev,
-                "ci_low": ci_low,
-                "ci_high": ci_high,
-                "normalized_avg": mean(norms) if norms else 0.0,
-                "worst_score": worst_score,
-                "win_ratio": win_ratio,
-                "dominance_index": dominance_index,
-                "matchups_played": n
-            }
+    def play_matchup(self, strategy1_class, strategy2_class):
+        games = self.play_matchup_games(strategy1_class, strategy2_class)
+        self.report_games(strategy1_class.name, strategy2_class.name, games)
+        return self.tally_games(games)
+
+    def play_matchup_games(self, strategy1_class, strategy2_class):
+        if not self.EARLY_STOP_TOLERANCE:
+            return self.play_games(strategy1_class, strategy2_class, self.NUM_GAMES_PER_MATCH)
+        return self.play_games_until_stable(strategy1_class, strategy2_class)
+
+    def report_games(self, name1, name2, games, first_game=0):
+        if self.events.thread is None:
+            return
+        for game_index, (norm1, norm2, score1, score2, wins1, wins2, draws, _) in enumerate(games, first_game):
+            self.events.emit(
+                GAME_FINISHED, strategies=(name1, name2), game=game_index, normalized=(norm1, norm2),
+                scores=(score1, score2), wins=(wins1, wins2), draws=draws
+            )
+
+    def play_games_until_stable(self, strategy1_class, strategy2_class):
+        """Plays games until the 95% CI half-width of the matchup score drops below EARLY_STOP_TOLERANCE.
+
+        At least EARLY_STOP_MIN_GAMES and at most NUM_GAMES_PER_MATCH games are played.
+        """
+        games = []
+        score_stats = RunningStats()
+        block = self.EARLY_STOP_MIN_GAMES
+        while len(games) < self.NUM_GAMES_PER_MATCH:
+            num_games = min(block, self.NUM_GAMES_PER_MATCH - len(games))
+            for game in self.play_games(strategy1_class, strategy2_class, num_games, len(games)):
+                games.append(game)
+                score_stats.add(game[2], game[0])
+            if score_stats.n >= self.EARLY_STOP_MIN_GAMES and score_stats.ci_margin() < self.EARLY_STOP_TOLERANCE:
+                break
+            # Batched runs keep advancing whole blocks in lockstep; scalar runs re-check after every game
+            block = self.EARLY_STOP_MIN_GAMES if self.BATCHED_GAMES else 1
+        return games
+
+    def matchup_result(self, name1, name2, totals):
+        num_games = totals["games"]
+        total_wins1, total_wins2 = totals["wins"]
+        sum_norm1, sum_norm2 = totals["sum_norm"]
+        sum_score1, sum_score2 = totals["sum_score"]
+        decisive_rounds = total_wins1 + total_wins2 or 1
 
         return {
-            "final_scores": final_avg_scores,
-            "score_stats": score_stats,
-            "matchups": matchups,
-            "metrics": detailed_stats
+            "strategies": (name1, name2),
+            "wins": (total_wins1, total_wins2),
+            "draws": totals["draws"],
+            "winrates": (
+                total_wins1 / decisive_rounds,
+                total_wins2 / decisive_rounds
+            ),
+            "scores": (sum_score1 / num_games, sum_score2 / num_games),
+            "normalized": (sum_norm1 / num_games, sum_norm2 / num_games),
+            "games": num_games,
+            "violations": totals.get("violations", (0, 0))
         }
+
+    def make_reporters(self):
+        reporters = [ConsoleReporter(self.NUM_GAMES_PER_MATCH)] if self.REPORTER == "console" else []
+        if self.EVENTS_PATH:
+            reporters.append(NDJSONReporter(self.EVENTS_PATH))
+        return reporters
+
+    @contextmanager
+    def reporting(self, reporter=None):
+        """Routes events to `reporter` (a Reporter or a list of them; None = the configured ones) until exit.
+
+        With RATINGS_PATH set, the persisted ratings are updated from every game as well.
+        """
+        if reporter is None:
+            reporters = self.make_reporters()
+        elif isinstance(reporter, Reporter):
+            reporters = [reporter]
+        else:
+            reporters = list(reporter)
+        if self.RATINGS_PATH:
+            reporters.append(RatingReporter(GlickoRatings(self.RATINGS_PATH)))
+        outer, self.events = self.events, EventBus(reporters)
+        try:
+            yield self.events
+        finally:
+            self.events.close()
+            self.events = outer
+
+    def iter_tournament(self, strategy_classes, workers=None, stats=None, previous=None, reporter=None):
+        """Yields each round-robin matchup result as soon as it is available.
+
+        Nothing is kept per matchup once it is yielded (on a pool, matchups that finish
+        ahead of their turn wait until then); pass a TournamentStats as `stats` to have
+        the per-strategy accumulators updated before each result is yielded. Pairs found
+        in the metrics of a `previous` tournament result are reused as they are, and
+        with CACHE_DIR and SEED set, matchups already in the cache are served from it. Only
+        the rest are played. With CHECKPOINT_PATH set, each result is journaled as it
+        is yielded and, when RESUME is on, matchups already in the journal are skipped.
+        Match, game and tournament events go to `reporter` (see reporting()).
+        """
+        pairs = self.round_robin_pairs(strategy_classes)
+        with self.reporting(reporter) as events:
+            yield from self._iter_pairs(pairs, workers, stats, previous, events, self.open_checkpoint())
+            self.report_finished(events, stats, len(pairs))
+
+    def report_finished(self, events, stats, num_matchups):
+        if stats is not None:
+            events.emit(TOURNAMENT_FINISHED, final_scores=stats.final_scores(), score_stats=stats.score_stats())
+        else:
+            events.emit(TOURNAMENT_FINISHED, matchups=num_matchups)
+
+    def open_checkpoint(self):
+        # One per tournament: opening it rewrites the journal, which without RESUME empties it
+        return TournamentCheckpoint(self.CHECKPOINT_PATH, self, self.RESUME) if self.CHECKPOINT_PATH else None
+
+    def _iter_pairs(self, pairs, workers, stats, previous, events, checkpoint=None):
+        reused = self.previous_results(previous)
+        if checkpoint:
+            reused.update(self.previous_results(checkpoint.previous()))
+
+        # An unseeded run is one random sample, which must not be served again as if it were the result
+        cache = MatchupCache(self.CACHE_DIR) if self.CACHE_DIR and self.SEED is not None else None
+        keys = {}  # position -> cache key of each matchup that has to be played
+        for position, (s1_cls, s2_cls) in enumerate(pairs):
+            if (s1_cls.name, s2_cls.name) in reused:
+                continue
+            key = cache.key(self, s1_cls, s2_cls) if cache and self.cacheable(s1_cls, s2_cls) else None
+            if key is None or cache.get(key) is None:
+                keys[position] = key
+        missing = list(keys)
+        for position in missing:
+            events.emit(MATCH_STARTED, strategies=(pairs[position][0].name, pairs[position][1].name))
+        played = self.play_matchups([pairs[position] for position in missing], workers)
+
+        # Matchups are journaled and cached the moment they finish, which on a pool may be out of
+        # order; stats and events still see them in roster order, as a serial run does. Only the
+        # ones that finished ahead of their turn are held, until they are yielded
+        finished = {}
+        for position, (s1_cls, s2_cls) in enumerate(pairs):
+            names = (s1_cls.name, s2_cls.name)
+            if position in keys:
+                while position not in finished:
+                    index, totals = next(played)
+                    done = missing[index]
+                    finished[done] = self._finish_matchup(pairs[done], totals, cache, keys[done], checkpoint)
+                result = finished.pop(position)
+            else:
+                result = reused.get(names)
+                if result is None:
+                    totals = cache.get(cache.key(self, s1_cls, s2_cls))
+                    result = self.matchup_result(*names, totals)
+                if checkpoint:
+                    checkpoint.record(result)
+            if stats is not None:
+                stats.add(result)
+            events.emit(MATCH_FINISHED, **result)
+            yield result
+
+    def _finish_matchup(self, pair, totals, cache, key, checkpoint):
+        result = self.matchup_result(pair[0].name, pair[1].name, totals)
+        if key:
+            cache.put(key, totals, result["strategies"])
+        if checkpoint:
+            checkpoint.record(result)
+        return result
+
+    def cacheable(self, strategy1_class, strategy2_class):
+        """Whether a matchup's result may go to and come from CACHE_DIR."""
+        return True
+
+    def previous_results(self, previous):
+        """Maps (name1, name2) to the matchup results of an earlier tournament, in both seat orders."""
+        if not previous:
+            return {}
+        reused = {}
+        for result in previous["metrics"]:
+            reused[result["strategies"]] = result
+            reused[result["strategies"][::-1]] = {
+                name: value[::-1] if isinstance(value, tuple) else value
+                for name, value in result.items()
+            }
+        return reused
+
+    def play_matchups(self, pairs, workers=None):
+        """Yields (index, totals) for each (strategy1, strategy2) pair as it finishes, serially or on a process pool."""
+        workers = self.NUM_WORKERS if workers is None else workers
+        if resolve_workers(workers) > 1 and len(pairs) > 1:
+            cost_model = CostModel(self.COST_MODEL_PATH)
+            yield from play_matchups_parallel(self, pairs, workers, self.GAMES_PER_TASK, cost_model)
+        else:
+            for index, (s1_cls, s2_cls) in enumerate(pairs):
+                yield index, self.play_matchup(s1_cls, s2_cls)
+
+    def round_robin_pairs(self, strategy_classes):
+        return [
+            (strategy_classes[i], strategy_classes[j])
+            for i in range(len(strategy_classes))
+            for j in range(i + 1, len(strategy_classes))
+        ]
+
+    def tournament_results(self, stats, results):
+        return tournament_results(stats, results)
+
+    def round_robin_tournament(self, strategy_classes, workers=None, previous=None, added=(), removed=(), reporter=None):
+        """Plays every pairing of strategy_classes and summarizes the scores.
+
+        For an incremental run, pass the earlier result as `previous` together with
+        the roster delta: strategies in `added` join the roster, names in `removed`
+        leave it. Only pairings missing from `previous` are played; matchups of
+        removed strategies are dropped and final_scores/score_stats are recomputed
+        from the merged set. Progress is reported through `reporter` (by default the
+        configured console/NDJSON sinks).
+        """
+        # A strategy listed in both strategy_classes and added (or twice) plays once, under its first entry
+        roster = {}
+        for cls in [*strategy_classes, *added]:
+            if cls.name not in removed:
+                roster.setdefault(cls.name, cls)
+        roster = list(roster.values())
+        stats = TournamentStats(self.NUM_GAMES_PER_MATCH)
+        detailed_stats = []
+
+        for result in self.iter_tournament(roster, workers, stats, previous, reporter):
+            detailed_stats.append(result)
+
+        return self.tournament_results(stats, detailed_stats)
+
+    def budgeted_tournament(self, strategy_classes, game_budget=None, workers=None, reporter=None):
+        """Round robin with a total game budget spread by variance instead of a fixed count per matchup."""
+        game_budget = self.GAME_BUDGET if game_budget is None else game_budget
+        workers = self.NUM_WORKERS if workers is None else workers
+        pairs = self.round_robin_pairs(strategy_classes)
+        game_lists = allocate_games(self, pairs, game_budget, self.PILOT_GAMES, workers)
+
+        stats = TournamentStats(self.NUM_GAMES_PER_MATCH)
+        detailed_stats = []
+        with self.reporting(reporter) as events:
+            for (s1_cls, s2_cls), games in zip(pairs, game_lists):
+                self.report_games(s1_cls.name, s2_cls.name, games)
+                result = self.matchup_result(s1_cls.name, s2_cls.name, self.tally_games(games))
+                stats.add(result)
+                events.emit(MATCH_FINISHED, **result)
+                detailed_stats.append(result)
+            self.report_finished(events, stats, len(pairs))
+
+        return self.tournament_results(stats, detailed_stats)
+
+    def swiss_tournament(self, strategy_classes, rounds=None, workers=None, reporter=None):
+        """Swiss system: each round pairs strategies of similar standing that have not met yet.
+
+        Plays about N/2 matchups per round over ceil(log2 N) + 1 rounds by default
+        (SWISS_ROUNDS overrides), instead of N(N-1)/2. Standings are the average matchup
+        score so far. The result carries rank-stability diagnostics, including how far
+        ranks still moved between the last rounds.
+        """
+        rounds = rounds or self.SWISS_ROUNDS or math.ceil(math.log2(max(len(strategy_classes), 2))) + 1
+        stats = TournamentStats(self.NUM_GAMES_PER_MATCH)
+        detailed_stats = []
+        played = set()
+        history = []
+        by_name = {cls.name: cls for cls in strategy_classes}
+
+        with self.reporting(reporter) as events:
+            checkpoint = self.open_checkpoint()
+            standings = [cls.name for cls in strategy_classes]
+            for _ in range(rounds):
+                pairs = swiss_pairs([by_name[name] for name in standings], played)
+                if not pairs:
+                    break
+                for result in self._iter_pairs(pairs, workers, stats, None, events, checkpoint):
+                    played.add(frozenset(result["strategies"]))
+                    detailed_stats.append(result)
+                standings = self.standings(stats, strategy_classes)
+                history.append(standings)
+            self.report_finished(events, stats, len(detailed_stats))
+
+        results = self.tournament_results(stats, detailed_stats)
+        results["diagnostics"] = rank_diagnostics(results["score_stats"], history)
+        return results
+
+    def sampled_tournament(self, strategy_classes, opponents=None, workers=None, reporter=None):
+        """Plays every strategy against `opponents` random others (SAMPLED_OPPONENTS by default) instead of all of them."""
+        opponents = opponents or self.SAMPLED_OPPONENTS
+        pairs = sampled_pairs(strategy_classes, opponents, self.SEED)
+        stats = TournamentStats(self.NUM_GAMES_PER_MATCH)
+        with self.reporting(reporter) as events:
+            detailed_stats = list(self._iter_pairs(pairs, workers, stats, None, events, self.open_checkpoint()))
+            self.report_finished(events, stats, len(pairs))
+
+        results = self.tournament_results(stats, detailed_stats)
+        results["diagnostics"] = rank_diagnostics(results["score_stats"])
+        return results
+
+    def standings(self, stats, strategy_classes):
+        # Strategies that have not played yet rank as if they had averaged 0
+        averages = {cls.name: 0.0 for cls in strategy_classes}
+        averages.update({name: s.mean for name, s in stats.strategies.items()})
+        return sorted(averages, key=lambda name: -averages[name])
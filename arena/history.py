@@ -0,0 +1,24 @@
+from collections import deque
+from itertools import islice
+
+
+class RingHistory(deque):
+    """Move history that keeps only its last maxlen entries, indexed and sliced like a list.
+
+    Slices are built from the end that is asked for, so history[-3:] costs three
+    steps however long the game has run.
+    """
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return super().__getitem__(index)
+        size = len(self)
+        start, stop, step = index.indices(size)
+        if step != 1:
+            return list(self)[index]
+        if stop <= start:
+            return []
+        items = list(islice(reversed(self), size - stop, size - start))
+        items.reverse()
+        return items
+
@@ -0,0 +1,72 @@
+import numpy as np
+
+from arena.moves import OUTCOME
+from arena.specs import strategy_attribute
+
+UNIFORM = (1 / 3, 1 / 3, 1 / 3)
+
+
+def mixed_policy(move, prob):
+    """Plays `move` with probability prob and a uniformly random move otherwise."""
+    return tuple(prob * (m == move) + (1 - prob) / 3 for m in range(3))
+
+
+def has_markov_model(strategy_class):
+    return strategy_attribute(strategy_class, "markov_policy") is not None
+
+
+def joint_chain(strategy1, strategy2):
+    """Transition matrix and per-state expected outcome counts of the joint chain of two strategies.
+
+    Each strategy declares its state space through three methods on integer moves:
+    markov_initial_state(), markov_policy(state) giving the (rock, paper, scissors)
+    probabilities of its next move, and markov_next_state(state, own_move,
+    opponent_move). The two players draw from independent streams, so a joint state
+    moves on with probability policy1[m1] * policy2[m2]. Only states reachable from
+    the initial pair are built.
+    """
+    start = (strategy1.markov_initial_state(), strategy2.markov_initial_state())
+    index = {start: 0}
+    pending = [start]
+    edges = []  # (from, to, probability, outcome code)
+    while pending:
+        state = pending.pop()
+        state1, state2 = state
+        policy1 = strategy1.markov_policy(state1)
+        policy2 = strategy2.markov_policy(state2)
+        for m1 in range(3):
+            for m2 in range(3):
+                p = policy1[m1] * policy2[m2]
+                if p == 0:
+                    continue
+                nxt = (strategy1.markov_next_state(state1, m1, m2), strategy2.markov_next_state(state2, m2, m1))
+                if nxt not in index:
+                    index[nxt] = len(index)
+                    pending.append(nxt)
+                edges.append((index[state], index[nxt], p, OUTCOME[m1][m2]))
+
+    transitions = np.zeros((len(index), len(index)))
+    outcomes = np.zeros((len(index), 3))
+    for source, target, p, code in edges:
+        transitions[source, target] += p
+        outcomes[source, code] += p
+    return transitions, outcomes
+
+
+def expected_counts(strategy1, strategy2, num_rounds):
+    """Exact expected (draws, wins1, wins2) over num_rounds rounds, via one matrix power.
+
+    The chain is augmented with three accumulator columns, [[P, R], [0, I]], so that
+    the initial distribution times its num_rounds-th power carries the summed
+    outcome probabilities of every round.
+    """
+    transitions, outcomes = joint_chain(strategy1, strategy2)
+    size = len(transitions)
+    augmented = np.zeros((size + 3, size + 3))
+    augmented[:size, :size] = transitions
+    augmented[:size, size:] = outcomes
+    augmented[size:, size:] = np.eye(3)
+    initial = np.zeros(size + 3)
+    initial[0] = 1.0
+    draws, wins1, wins2 = initial @ np.linalg.matrix_power(augmented, num_rounds)[:, size:]
+    return float(draws), float(wins1), float(wins2)
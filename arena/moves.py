@@ -0,0 +1,56 @@
+ROCK, PAPER, SCISSORS = 0, 1, 2
+
+MOVES = ("rock", "paper", "scissors")
+MOVE_INDEX = {move: index for index, move in enumerate(MOVES)}
+
+# OUTCOME[a][b]: 0 = draw, 1 = a wins, 2 = b wins (same codes as play_single_round)
+OUTCOME = (
+    (0, 2, 1),
+    (1, 0, 2),
+    (2, 1, 0),
+)
+
+# PAYOFF[a][b]: score delta for the player of move a (+1 win, 0 draw, -1 loss)
+PAYOFF = (
+    (0, -1, 1),
+    (1, 0, -1),
+    (-1, 1, 0),
+)
+
+# COUNTER[m] is the move that beats m
+COUNTER = (PAPER, SCISSORS, ROCK)
+
+# String-keyed views of the same tables for strategies that still speak in move names
+COUNTER_MOVE = {MOVES[m]: MOVES[COUNTER[m]] for m in range(3)}
+SCORE_DELTA = {(MOVES[a], MOVES[b]): PAYOFF[a][b] for a in range(3) for b in range(3)}
+
+
+def score_delta(move1, move2):
+    return SCORE_DELTA[move1, move2]
+
+
+class IntMoveAdapter:
+    """Wraps a string-returning strategy so the engine can drive it with integer moves."""
+
+    int_moves = True
+
+    def __init__(self, strategy):
+        self.strategy = strategy
+        self.name = strategy.name
+        self._play = strategy.play
+        self._handle_moves = strategy.handle_moves
+        if hasattr(strategy, "state_key"):
+            self.state_key = strategy.state_key
+
+    def play(self):
+        return MOVE_INDEX[self._play()]
+
+    def handle_moves(self, own_move, opponent_move):
+        self._handle_moves(MOVES[own_move], MOVES[opponent_move])
+
+
+def as_int_strategy(strategy):
+    """Returns the instance unchanged if it is int-native, otherwise an IntMoveAdapter around it."""
+    if getattr(strategy, "int_moves", False):
+        return strategy
+    return IntMoveAdapter(strategy)
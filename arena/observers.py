@@ -0,0 +1,15 @@
+class RoundObserver:
+    """Sees the rounds of every game the engine plays, in one on_game() call per game.
+
+    moves1 and moves2 are bytes-like sequences of integer moves (see arena.moves),
+    one per round played; a forfeited game is reported with the rounds played before
+    the forfeit. on_game() runs on the engine's thread, inside whichever process
+    plays the game, so in a parallel run each worker calls its own copy of the
+    observer. Register observers with GameEngine.add_observer().
+    """
+
+    def on_game(self, strategy1_name, strategy2_name, game_index, moves1, moves2):
+        pass
+
+    def close(self):
+        pass
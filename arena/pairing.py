@@ -0,0 +1,80 @@
+import bisect
+import math
+import random
+
+
+def swiss_pairs(ranked, played):
+    """Pairs neighbours of a ranking, skipping rematches.
+
+    `ranked` is the strategy classes best first and `played` a set of frozenset name
+    pairs already met. Each strategy is paired with the next one down that it has not
+    played yet; one left without an opponent sits the round out.
+    """
+    pending = list(ranked)
+    pairs = []
+    while len(pending) > 1:
+        first = pending.pop(0)
+        for index, other in enumerate(pending):
+            if frozenset((first.name, other.name)) not in played:
+                pairs.append((first, pending.pop(index)))
+                break
+    return pairs
+
+
+def sampled_pairs(strategy_classes, opponents, seed=None):
+    """Gives every strategy `opponents` distinct random opponents; about N * opponents matchups in all.
+
+    Pairs are seated in roster order and listed once, however many times they were drawn.
+    """
+    rng = random.Random(seed) if seed is not None else random.Random(random.getrandbits(64))
+    count = len(strategy_classes)
+    opponents = min(opponents, count - 1)
+    seen = set()
+    pairs = []
+    for i in range(count):
+        for j in rng.sample(range(count - 1), opponents):
+            if j >= i:
+                j += 1
+            key = (min(i, j), max(i, j))
+            if key not in seen:
+                seen.add(key)
+                pairs.append((strategy_classes[key[0]], strategy_classes[key[1]]))
+    return pairs
+
+
+def rank_intervals(score_stats):
+    """Best and worst rank each strategy could hold given the 95% CIs of its average score.
+
+    A strategy can only be beaten by those whose whole CI lies above its own, and only
+    beats those whose whole CI lies below, so the interval width measures how settled
+    its place in the leaderboard is. Strategies with fewer than two matchups get the
+    full range.
+    """
+    bounds = {
+        name: (s["ci_low"], s["ci_high"]) if s["matchups_played"] > 1 else (-math.inf, math.inf)
+        for name, s in score_stats.items()
+    }
+    lows = sorted(low for low, _ in bounds.values())
+    highs = sorted(high for _, high in bounds.values())
+    count = len(bounds)
+    return {
+        name: (1 + count - bisect.bisect_right(lows, high), count - bisect.bisect_left(highs, low))
+        for name, (low, high) in bounds.items()
+    }
+
+
+def rank_displacement(before, after):
+    """Mean absolute change in rank between two rankings of the same strategies."""
+    position = {name: rank for rank, name in enumerate(before)}
+    moves = [abs(position[name] - rank) for rank, name in enumerate(after) if name in position]
+    return sum(moves) / len(moves) if moves else 0.0
+
+
+def rank_diagnostics(score_stats, history=()):
+    """Rank-stability summary: per-strategy rank intervals, their mean width, and round-to-round rank shifts."""
+    intervals = rank_intervals(score_stats)
+    return {
+        "rank_intervals": intervals,
+        "mean_interval_width": sum(worst - best for best, worst in intervals.values()) / max(len(intervals), 1),
+        "rank_displacement": [rank_displacement(a, b) for a, b in zip(history, history[1:])]
+    }
@@ -0,0 +1,107 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from arena.specs import StrategySpec
+
+
+def resolve_workers(workers):
+    if not workers or workers < 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def split_games(num_games, games_per_task):
+    if not games_per_task or games_per_task >= num_games:
+        return [num_games]
+    chunks = [games_per_task] * (num_games // games_per_task)
+    if num_games % games_per_task:
+        chunks.append(num_games % games_per_task)
+    return chunks
+
+
+def _play_games(engine, spec1, spec2, num_games, first_game=0):
+    return engine.play_games(spec1, spec2, num_games, first_game)
+
+
+def _timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def _play_games_timed(engine, spec1, spec2, num_games, first_game=0):
+    return _timed(engine.play_games, spec1, spec2, num_games, first_game)
+
+
+def _play_games_until_stable(engine, spec1, spec2):
+    return _timed(engine.play_games_until_stable, spec1, spec2)
+
+
+def play_matchups_parallel(engine, pairs, workers, games_per_task=0, cost_model=None):
+    """Plays (strategy1, strategy2) pairs on a process pool, yielding (index, totals) as each matchup finishes.
+
+    Workers only receive StrategySpec objects (module path + kwargs) and rebuild the
+    strategy classes on their side. With games_per_task set, each matchup's games are
+    split into chunks that run on different workers; the per-game results are tallied
+    back in game order, so the totals match a serial run exactly. Early stopping needs
+    to see games in order, so it keeps each matchup on a single worker. Game results
+    are reported from this process, as the workers' engines carry no event bus.
+
+    With a CostModel, matchups are submitted longest-job-first by their predicted
+    cost, so the slowest ones do not end up as stragglers on an otherwise idle pool;
+    every matchup's timing is fed back into the model, which is saved at the end.
+    """
+    chunks = split_games(engine.NUM_GAMES_PER_MATCH, games_per_task)
+    offsets = [sum(chunks[:k]) for k in range(len(chunks))]
+    order = list(range(len(pairs)))
+    if cost_model is not None:
+        order.sort(key=lambda index: -cost_model.game_cost(pairs[index][0].name, pairs[index][1].name))
+
+    futures = [None] * len(pairs)
+    pool = ProcessPoolExecutor(max_workers=resolve_workers(workers))
+    try:
+        for index in order:
+            spec1 = StrategySpec.from_class(pairs[index][0])
+            spec2 = StrategySpec.from_class(pairs[index][1])
+            if engine.EARLY_STOP_TOLERANCE:
+                futures[index] = [pool.submit(_play_games_until_stable, engine, spec1, spec2)]
+            else:
+                futures[index] = [
+                    pool.submit(_play_games_timed, engine, spec1, spec2, n, first_game)
+                    for n, first_game in zip(chunks, offsets)
+                ]
+
+        matchup_of = {future: index for index, chunk_futures in enumerate(futures) for future in chunk_futures}
+        chunks_left = [len(chunk_futures) for chunk_futures in futures]
+        for done in as_completed(matchup_of):
+            index = matchup_of[done]
+            chunks_left[index] -= 1
+            if chunks_left[index]:
+                continue
+            s1, s2 = pairs[index]
+            games, seconds = [], 0.0
+            for future in futures[index]:
+                chunk_games, elapsed = future.result()
+                games.extend(chunk_games)
+                seconds += elapsed
+            if cost_model is not None:
+                cost_model.observe(s1.name, s2.name, seconds, len(games))
+            engine.report_games(s1.name, s2.name, games)
+            yield index, engine.tally_games(games)
+    finally:
+        # A failed worker or an abandoned generator drops the queued matchups instead of waiting for them
+        pool.shutdown(wait=False, cancel_futures=True)
+        if cost_model is not None:
+            cost_model.save()
+
+
+def play_game_tasks(engine, tasks, pool=None):
+    """Plays (strategy1, strategy2, num_games, first_game) tasks, on `pool` if given, returning per-task game lists in order."""
+    if pool is None:
+        return [engine.play_games(s1, s2, n, first_game) for s1, s2, n, first_game in tasks]
+    futures = [
+        pool.submit(_play_games, engine, StrategySpec.from_class(s1), StrategySpec.from_class(s2), n, first_game)
+        for s1, s2, n, first_game in tasks
+    ]
+    return [future.result() for future in futures]
@@ -0,0 +1,82 @@
+import json
+import math
+import os
+
+from arena.events import GAME_FINISHED, Reporter
+from arena.storage import write_json
+
+Q = math.log(10) / 400
+
+
+def _g(rd):
+    return 1 / math.sqrt(1 + 3 * Q * Q * rd * rd / (math.pi * math.pi))
+
+
+class GlickoRatings:
+    """Glicko ratings (rating plus rating deviation) updated after every single game.
+
+    A game's result is the first player's normalized proportion mapped to [0, 1]
+    (1 = clear win, 0.5 = even, 0 = clear loss), so ratings need no fixed schedule:
+    round robin, Swiss, gauntlets or an endless stream of games all feed it the same
+    way. Before each game a strategy's deviation grows by `drift`, which keeps
+    ratings able to follow strategies that change, then shrinks with the evidence.
+    Saved ratings are picked up again on load, so later games refine them.
+    """
+
+    def __init__(self, path=None, initial_rating=1500.0, initial_rd=350.0, drift=5.0):
+        self.path = path
+        self.initial_rating = initial_rating
+        self.initial_rd = initial_rd
+        self.drift = drift
+        self.ratings = {}
+        if path and os.path.exists(path):
+            with open(path, "r") as file:
+                self.ratings = {name: tuple(value) for name, value in json.load(file).items()}
+
+    def get(self, name):
+        """(rating, deviation, games) of a strategy; unseen strategies start at the initial values."""
+        return self.ratings.get(name, (self.initial_rating, self.initial_rd, 0))
+
+    def update(self, name1, name2, score1):
+        """Rates one game in which name1 scored score1 in [0, 1] against name2."""
+        before = {name: self.get(name) for name in (name1, name2)}
+        for name, opponent, score in ((name1, name2, score1), (name2, name1, 1 - score1)):
+            r, rd, games = before[name]
+            r_opp, rd_opp, _ = before[opponent]
+            rd = min(math.sqrt(rd * rd + self.drift * self.drift), self.initial_rd)
+            g = _g(rd_opp)
+            e = 1 / (1 + 10 ** (-g * (r - r_opp) / 400))
+            d2_inv = Q * Q * g * g * e * (1 - e)
+            denominator = 1 / (rd * rd) + d2_inv
+            self.ratings[name] = (r + Q / denominator * g * (score - e), math.sqrt(1 / denominator), games + 1)
+
+    def update_normalized(self, name1, name2, norm1):
+        self.update(name1, name2, (norm1 + 1) / 2)
+
+    def leaderboard(self):
+        """Strategies by conservative rating (rating - 2 * deviation), best first."""
+        rows = [
+            {"strategy": name, "rating": r, "rd": rd, "games": games, "conservative": r - 2 * rd}
+            for name, (r, rd, games) in self.ratings.items()
+        ]
+        return sorted(rows, key=lambda row: -row["conservative"])
+
+    def save(self):
+        if not self.path:
+            return
+        write_json(self.path, self.ratings, indent=2, sort_keys=True)
+
+
+class RatingReporter(Reporter):
+    """Feeds every game_finished event into a GlickoRatings and saves it when the run ends."""
+
+    def __init__(self, ratings):
+        self.ratings = ratings
+
+    def handle(self, event, payload):
+        if event == GAME_FINISHED:
+            name1, name2 = payload["strategies"]
+            self.ratings.update_normalized(name1, name2, payload["normalized"][0])
+
+    def close(self):
+        self.ratings.save()
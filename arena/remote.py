@@ -0,0 +1,194 @@
+import asyncio
+import json
+import random
+import sys
+
+from arena.moves import MOVE_INDEX, MOVES, as_int_strategy
+from arena.rng import RoutedPlayer
+from arena.sandbox import StrategyForfeit
+from arena.specs import StrategySpec
+
+# Wire protocol, one JSON object per message and one reply per request:
+#   {"op": "start", "game": id, "seed": int}   -> {"ok": true}
+#   {"op": "play", "last": [own, opp] | null}  -> {"move": "rock" | "paper" | "scissors"}
+#   {"op": "end", "last": [own, opp]}          -> {"ok": true}
+# The moves of a round ride along with the next play request, so a round costs one round trip.
+# Over "tcp" messages are newline-delimited on one connection per game; over "http" they are
+# POSTed to / on a keep-alive connection per game. A bot that cannot be reached, drops the
+# connection, answers late or answers nonsense raises StrategyForfeit for its seat.
+
+# What a broken connection or a malformed reply raises: OSError covers refused and reset
+# connections and (from Python 3.11) timeouts, IncompleteReadError a bot that hangs up mid-reply,
+# ValueError undecodable JSON
+REQUEST_ERRORS = (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError)
+
+
+class RemoteStrategy:
+    """A bot reachable over the network, usable wherever a strategy class is expected by AsyncGameEngine."""
+
+    def __init__(self, name, host, port, protocol="tcp"):
+        self.name = name
+        self.host = host
+        self.port = port
+        self.protocol = protocol
+
+    async def connect(self, game_id, seed, seat=0, timeout=None):
+        """Opens a game on the bot; every request, the connection included, may take up to `timeout` seconds."""
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), timeout)
+        except REQUEST_ERRORS as error:
+            raise StrategyForfeit(seat, f"{self.name}: cannot connect: {error!r}") from error
+        player = RemotePlayer(self, reader, writer, seat, timeout)
+        try:
+            await player.request({"op": "start", "game": game_id, "seed": seed})
+        except StrategyForfeit:
+            writer.close()
+            raise
+        return player
+
+    def __repr__(self):
+        return f"RemoteStrategy({self.name!r}, {self.host!r}, {self.port!r}, {self.protocol!r})"
+
+
+class RemotePlayer:
+    int_moves = True
+
+    def __init__(self, strategy, reader, writer, seat=0, timeout=None):
+        self.strategy = strategy
+        self.reader = reader
+        self.writer = writer
+        self.seat = seat
+        self.timeout = timeout
+        self.failed = False
+        self.last = None
+
+    async def request(self, message):
+        try:
+            return await asyncio.wait_for(self._exchange(message), self.timeout)
+        except REQUEST_ERRORS as error:
+            self.failed = True
+            raise StrategyForfeit(self.seat, f"{self.strategy.name}: {error!r}") from error
+
+    async def _exchange(self, message):
+        body = json.dumps(message).encode()
+        if self.strategy.protocol == "http":
+            self.writer.write(
+                b"POST / HTTP/1.1\r\nHost: %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s"
+                % (self.strategy.host.encode(), len(body), body)
+            )
+            await self.writer.drain()
+            return json.loads(await _read_http_body(self.reader))
+        self.writer.write(body + b"\n")
+        await self.writer.drain()
+        return json.loads(await self.reader.readline())
+
+    async def play(self):
+        reply = await self.request({"op": "play", "last": self.last})
+        try:
+            return MOVE_INDEX[reply["move"]]
+        except (KeyError, TypeError) as error:
+            self.failed = True
+            raise StrategyForfeit(self.seat, f"{self.strategy.name}: not a move: {reply!r}") from error
+
+    def handle_moves(self, own_move, opponent_move):
+        self.last = [MOVES[own_move], MOVES[opponent_move]]
+
+    async def close(self):
+        try:
+            # A bot that already failed is not waited on again; its game is scored either way
+            if not self.failed:
+                await self.request({"op": "end", "last": self.last})
+        except StrategyForfeit:
+            pass
+        finally:
+            self.writer.close()
+
+
+class LocalPlayer:
+    """Runs an in-process strategy behind the same awaitable play() as a RemotePlayer."""
+
+    int_moves = True
+
+    def __init__(self, strategy_factory, seed=None):
+        if seed is None:
+            self.player = as_int_strategy(strategy_factory())
+        else:
+            self.player = RoutedPlayer(strategy_factory, random.Random(seed))
+        self.handle_moves = self.player.handle_moves
+
+    async def play(self):
+        return self.player.play()
+
+    async def close(self):
+        pass
+
+
+async def _read_http_body(reader):
+    headers = {}
+    await reader.readline()  # request or status line
+    while True:
+        line = (await reader.readline()).strip()
+        if not line:
+            break
+        key, _, value = line.decode().partition(":")
+        headers[key.strip().lower()] = value.strip()
+    return await reader.readexactly(int(headers.get("content-length", 0)))
+
+
+async def serve_strategy(strategy_class, host="127.0.0.1", port=0, protocol="tcp"):
+    """Stand-in bot server hosting a local strategy, one fresh instance per game; returns the asyncio server.
+
+    Each game's `random` draws come from the seed sent with "start", so a seeded
+    tournament against served bots reproduces the in-process one exactly.
+    """
+    spec = StrategySpec.from_class(strategy_class)
+
+    async def handle(reader, writer):
+        player = None
+        try:
+            while True:
+                if protocol == "http":
+                    body = await _read_http_body(reader)
+                else:
+                    body = await reader.readline()
+                if not body:
+                    break
+                message = json.loads(body)
+                if message.get("last") and player is not None:
+                    own, opponent = message["last"]
+                    player.handle_moves(MOVE_INDEX[own], MOVE_INDEX[opponent])
+                if message["op"] == "start":
+                    player = RoutedPlayer(spec, random.Random(message["seed"]))
+                    reply = {"ok": True}
+                elif message["op"] == "play":
+                    reply = {"move": MOVES[player.play()]}
+                else:
+                    reply = {"ok": True}
+                data = json.dumps(reply).encode()
+                if protocol == "http":
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s" % (len(data), data))
+                else:
+                    writer.write(data + b"\n")
+                await writer.drain()
+                if message["op"] == "end":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+async def _serve_forever(strategy_class, host, port, protocol):
+    server = await serve_strategy(strategy_class, host, port, protocol)
+    print(f"Serving {strategy_class.name} over {protocol} on {server.sockets[0].getsockname()}")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    # python -m arena.remote strategies.markov_strategy:MarkovStrategy [PORT] [tcp|http]
+    module, _, qualname = sys.argv[1].partition(":")
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 9000
+    asyncio.run(_serve_forever(StrategySpec(module, qualname).load(), "127.0.0.1", port, sys.argv[3] if len(sys.argv) > 3 else "tcp"))
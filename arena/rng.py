@@ -0,0 +1,89 @@
+import hashlib
+import random
+import sys
+
+from arena.moves import as_int_strategy
+from arena.specs import StrategySpec
+
+
+class RandomRouter:
+    """Stands in for the `random` module inside strategy modules.
+
+    Every attribute lookup (random.choice, random.random, ...) is forwarded to the
+    stream of whichever strategy instance the engine is currently calling, so
+    existing strategies get their own seeded stream without code changes.
+    """
+
+    def __init__(self):
+        self.current = random._inst
+
+    def __getattr__(self, name):
+        return getattr(self.current, name)
+
+    def release(self):
+        self.current = random._inst
+
+
+ROUTER = RandomRouter()
+_routed_modules = set()
+
+
+def route_strategy_modules(strategy_class):
+    """Points `random` at ROUTER in the strategy's module and its sibling modules (its sub-strategies)."""
+    if isinstance(strategy_class, StrategySpec):
+        strategy_class = strategy_class.load()
+    module_name = strategy_class.__module__
+    if module_name in _routed_modules:
+        return
+    package = module_name.split(".")[0]
+    for name, module in list(sys.modules.items()):
+        if (name == package or name.startswith(package + ".")) and getattr(module, "random", None) is random:
+            module.random = ROUTER
+    _routed_modules.add(module_name)
+
+
+def stream_seed(seed, *key):
+    digest = hashlib.sha256(repr((seed,) + key).encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def game_seeds(seed, name1, name2, game_index):
+    """The seeds of the two per-player streams of one game, derived from the tournament seed, matchup and game index.
+
+    With seed None they are drawn from the global `random` state instead, so
+    random.seed() still pins a run.
+    """
+    if seed is None:
+        return random.getrandbits(64), random.getrandbits(64)
+    return stream_seed(seed, name1, name2, game_index, 0), stream_seed(seed, name1, name2, game_index, 1)
+
+
+def game_streams(seed, name1, name2, game_index):
+    """The two per-player streams of one game (see game_seeds)."""
+    seed1, seed2 = game_seeds(seed, name1, name2, game_index)
+    return random.Random(seed1), random.Random(seed2)
+
+
+class RoutedPlayer:
+    """Int-protocol player that switches ROUTER to its own stream before every call."""
+
+    int_moves = True
+
+    def __init__(self, strategy_factory, rng):
+        route_strategy_modules(strategy_factory)
+        self.rng = rng
+        ROUTER.current = rng
+        self.strategy = as_int_strategy(strategy_factory())
+        self.name = self.strategy.name
+        self._play = self.strategy.play
+        self._handle_moves = self.strategy.handle_moves
+        if hasattr(self.strategy, "state_key"):
+            self.state_key = self.strategy.state_key
+
+    def play(self):
+        ROUTER.current = self.rng
+        return self._play()
+
+    def handle_moves(self, own_move, opponent_move):
+        ROUTER.current = self.rng
+        self._handle_moves(own_move, opponent_move)
@@ -0,0 +1,210 @@
+import multiprocessing
+import os
+import random
+import struct
+import time
+from multiprocessing import shared_memory
+
+from arena.moves import as_int_strategy
+from arena.specs import StrategySpec
+
+RING_SLOTS = 64
+SLOT = struct.Struct("<BBBxxxxxQ")  # op/status, move or own move, opponent move, 64-bit argument
+COUNTERS = 4  # request head, request tail, response head, response tail
+REQ_HEAD, REQ_TAIL, RESP_HEAD, RESP_TAIL = range(COUNTERS)
+RING_OFFSET = COUNTERS * 8
+RING_BYTES = RING_SLOTS * SLOT.size
+
+RESET, PLAY, HANDLE, CLOSE = 1, 2, 3, 4
+OK, FAILED = 0, 1
+
+# Busy-wait this many polls before yielding the CPU; waiting is what sets the per-round latency.
+# On a single core spinning only delays the other side, so yield straight away there.
+SPIN_POLLS = 2000 if (os.cpu_count() or 1) > 1 else 0
+# An idle sandbox keeps yielding for about this long before it starts sleeping between polls
+IDLE_YIELD_SECONDS = 0.01
+
+
+class StrategyForfeit(Exception):
+    """A sandboxed strategy crashed, raised or hung, or a remote one failed; `seat` (0 or 1) says which player forfeits."""
+
+    def __init__(self, seat, reason):
+        super().__init__(f"seat {seat}: {reason}")
+        self.seat = seat
+        self.reason = reason
+
+
+class _Rings:
+    """Two single-producer/single-consumer rings in one shared-memory block: requests, then responses."""
+
+    def __init__(self, shm):
+        self.shm = shm
+        self._header = shm.buf[:RING_OFFSET]
+        self.counters = self._header.cast("Q")
+        self.buf = shm.buf
+
+    def put(self, ring, head, values):
+        # The slot is written before the head moves, so the reader never sees a half-filled slot
+        index = self.counters[head]
+        SLOT.pack_into(self.buf, RING_OFFSET + ring * RING_BYTES + (index % RING_SLOTS) * SLOT.size, *values)
+        self.counters[head] = index + 1
+
+    def get(self, ring, tail):
+        index = self.counters[tail]
+        values = SLOT.unpack_from(self.buf, RING_OFFSET + ring * RING_BYTES + (index % RING_SLOTS) * SLOT.size)
+        self.counters[tail] = index + 1
+        return values
+
+    def release(self):
+        # Every view into the block must go before SharedMemory.close() is allowed
+        self.counters.release()
+        self._header.release()
+        self.buf = None
+
+
+def _serve(shm_name, strategy_spec):
+    """Sandbox process: replays requests against its strategy, answering PLAY requests."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    rings = _Rings(shm)
+    counters = rings.counters
+    parent = os.getppid()
+    strategy, failed = None, False
+    polls, idle_since = 0, None
+    try:
+        while True:
+            if counters[REQ_HEAD] == counters[REQ_TAIL]:
+                polls += 1
+                if polls > SPIN_POLLS:
+                    now = time.monotonic()
+                    idle_since = idle_since or now
+                    if now - idle_since < IDLE_YIELD_SECONDS:
+                        os.sched_yield()
+                    else:
+                        time.sleep(0.001)
+                        if os.getppid() != parent:
+                            return
+                continue
+            polls, idle_since = 0, None
+            op, own_move, opponent_move, argument = rings.get(0, REQ_TAIL)
+            if op == RESET:
+                random.seed(argument)
+                try:
+                    strategy, failed = as_int_strategy(strategy_spec()), False
+                except Exception:
+                    strategy, failed = None, True
+            elif op == HANDLE and not failed:
+                try:
+                    strategy.handle_moves(own_move, opponent_move)
+                except Exception:
+                    failed = True
+            elif op == PLAY:
+                move = 0
+                if not failed:
+                    try:
+                        move = strategy.play()
+                        # Anything but a move index (a stray int, None, a string) would corrupt or crash the ring write
+                        failed = move not in (0, 1, 2)
+                    except Exception:
+                        failed = True
+                rings.put(1, RESP_HEAD, (FAILED, 0, 0, 0) if failed else (OK, int(move), 0, 0))
+            elif op == CLOSE:
+                return
+    finally:
+        counters = None
+        rings.release()
+        shm.close()
+
+
+class Sandbox:
+    """One strategy running in its own process, driven through shared-memory rings.
+
+    handle_moves() is posted without waiting for an answer, so every round costs a
+    single round trip (the PLAY request and its reply), with both sides polling the
+    ring counters instead of pickling messages through a pipe. A strategy that raises
+    or dies, or takes longer than `timeout` seconds to answer, forfeits: the call
+    raises StrategyForfeit and the process is restarted for the next game. This
+    isolates crashes and hangs; it is not a security boundary for hostile code.
+    """
+
+    int_moves = True
+
+    def __init__(self, strategy_class, seat, timeout=1.0):
+        self.spec = StrategySpec.from_class(strategy_class)
+        self.name = strategy_class.name
+        self.seat = seat
+        self.timeout = timeout
+        self.process = None
+        self.shm = None
+        self._start()
+
+    def _start(self):
+        self.shm = shared_memory.SharedMemory(create=True, size=RING_OFFSET + 2 * RING_BYTES)
+        self.shm.buf[:RING_OFFSET] = bytes(RING_OFFSET)
+        self.rings = _Rings(self.shm)
+        self.counters = self.rings.counters
+        self.process = multiprocessing.get_context("fork").Process(
+            target=_serve, args=(self.shm.name, self.spec), daemon=True
+        )
+        self.process.start()
+
+    def _stop(self, kill=False):
+        if self.process is not None:
+            if kill or not self.process.is_alive():
+                self.process.kill()
+            else:
+                self._post(CLOSE)
+            self.process.join(1.0)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join()
+            self.process = None
+        if self.shm is not None:
+            self.counters = None
+            self.rings.release()
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+    def _post(self, op, own_move=0, opponent_move=0, argument=0):
+        if self.counters[REQ_HEAD] - self.counters[REQ_TAIL] >= RING_SLOTS:
+            self._wait(lambda: self.counters[REQ_HEAD] - self.counters[REQ_TAIL] < RING_SLOTS)
+        self.rings.put(0, REQ_HEAD, (op, own_move, opponent_move, argument))
+
+    def _wait(self, ready):
+        for _ in range(SPIN_POLLS):
+            if ready():
+                return
+        deadline = time.monotonic() + self.timeout
+        while not ready():
+            if not self.process.is_alive():
+                raise StrategyForfeit(self.seat, f"{self.name} crashed")
+            if time.monotonic() > deadline:
+                raise StrategyForfeit(self.seat, f"{self.name} timed out")
+            os.sched_yield()
+
+    def new_game(self, seed):
+        """Restarts the process if the last game ended in a forfeit, then builds a fresh strategy seeded with seed."""
+        if self.process is None or not self.process.is_alive():
+            self._stop()
+            self._start()
+        self._post(RESET, argument=seed)
+        return self
+
+    def forfeited(self):
+        # A hung strategy may still be running: kill it so the next game starts clean
+        self._stop(kill=True)
+
+    def play(self):
+        self._post(PLAY)
+        counters = self.counters
+        self._wait(lambda: counters[RESP_HEAD] != counters[RESP_TAIL])
+        status, move, _, _ = self.rings.get(1, RESP_TAIL)
+        if status != OK:
+            raise StrategyForfeit(self.seat, f"{self.name} raised an exception")
+        return move
+
+    def handle_moves(self, own_move, opponent_move):
+        self._post(HANDLE, own_move, opponent_move)
+
+    def close(self):
+        self._stop()
@@ -0,0 +1,61 @@
+import importlib
+
+
+def strategy_attribute(strategy_class, name, default=None):
+    """Class attribute of a strategy class or of the class a StrategySpec points to."""
+    if isinstance(strategy_class, StrategySpec):
+        strategy_class = strategy_class.load()
+    return getattr(strategy_class, name, default)
+
+
+class StrategySpec:
+    """Picklable recipe for a strategy: import path plus constructor kwargs.
+
+    A spec can stand in for a strategy class anywhere the engine expects one:
+    calling it builds a fresh instance and it exposes the strategy's `name`.
+    """
+
+    def __init__(self, module, qualname, kwargs=None, name=None):
+        self.module = module
+        self.qualname = qualname
+        self.kwargs = dict(kwargs or {})
+        self._name = name
+        self._class = None
+
+    @classmethod
+    def from_class(cls, strategy_class, **kwargs):
+        if isinstance(strategy_class, cls):
+            return strategy_class
+        return cls(strategy_class.__module__, strategy_class.__qualname__, kwargs)
+
+    def load(self):
+        if self._class is None:
+            obj = importlib.import_module(self.module)
+            for attr in self.qualname.split("."):
+                obj = getattr(obj, attr)
+            self._class = obj
+        return self._class
+
+    @property
+    def name(self):
+        return self._name or self.load().name
+
+    def __call__(self):
+        return self.load()(**self.kwargs)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_class"] = None
+        return state
+
+    def __eq__(self, other):
+        return isinstance(other, StrategySpec) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def _key(self):
+        return (self.module, self.qualname, repr(sorted(self.kwargs.items())), self._name)
+
+    def __repr__(self):
+        return f"StrategySpec({self.module!r}, {self.qualname!r}, {self.kwargs!r})"
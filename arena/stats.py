@@ -0,0 +1,113 @@
+import math
+from collections import defaultdict
+
+
+class RunningStats:
+    """Constant-memory accumulator (Welford) for one strategy's per-matchup average scores."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.total = 0.0
+        self.game_total = 0.0
+        self.norm_total = 0.0
+        self.worst = math.inf
+        self.wins = 0
+        self.dominant = 0
+
+    def add(self, score, norm, games=1):
+        # score is one matchup's average, over `games` games
+        self.n += 1
+        delta = score - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (score - self.mean)
+        self.total += score
+        self.game_total += score * games
+        self.norm_total += norm
+        self.worst = min(self.worst, score)
+        if score > 0:
+            self.wins += 1
+        if score > 10:
+            self.dominant += 1
+
+    def merge(self, other):
+        # Chan et al. parallel combination, so partial accumulators can be joined
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.__dict__.update(other.__dict__)
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        self.total += other.total
+        self.game_total += other.game_total
+        self.norm_total += other.norm_total
+        self.worst = min(self.worst, other.worst)
+        self.wins += other.wins
+        self.dominant += other.dominant
+
+    def variance(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def ci_margin(self):
+        # Half-width of the 95% confidence interval of the mean
+        if self.n < 2:
+            return math.inf
+        return 1.96 * (math.sqrt(self.variance()) / math.sqrt(self.n))
+
+    def summary(self):
+        n = self.n
+        avg = self.total / n if n else 0.0
+        var = self.variance()
+        std_dev = math.sqrt(var)
+        margin = self.ci_margin() if n > 1 else 0.0
+        return {
+            "average": avg,
+            "total": self.game_total,
+            "variance": var,
+            "std_dev": std_dev,
+            "ci_low": avg - margin,
+            "ci_high": avg + margin,
+            "normalized_avg": self.norm_total / n if n else 0.0,
+            "worst_score": self.worst if n else 0.0,
+            "win_ratio": self.wins / n if n else 0.0,
+            "dominance_index": self.dominant / n if n else 0.0,
+            "matchups_played": n
+        }
+
+
+class TournamentStats:
+    """Per-strategy RunningStats fed from matchup results as they stream in."""
+
+    def __init__(self, games_per_match):
+        self.games_per_match = games_per_match
+        self.strategies = defaultdict(RunningStats)
+        self.violations = defaultdict(int)
+
+    def add(self, result):
+        games = result.get("games", self.games_per_match)
+        for name, score, norm in zip(result["strategies"], result["scores"], result["normalized"]):
+            self.strategies[name].add(score, norm, games)
+        for name, violations in zip(result["strategies"], result.get("violations", (0, 0))):
+            self.violations[name] += violations
+
+    def final_scores(self):
+        return {name: stats.total / stats.n if stats.n else 0.0 for name, stats in self.strategies.items()}
+
+    def score_stats(self):
+        return {name: stats.summary() for name, stats in self.strategies.items()}
+
+
+def tournament_results(stats, results):
+    """The summary a tournament returns: scores from the accumulators in `stats`, which were fed `results`."""
+    return {
+        "final_scores": stats.final_scores(),
+        "score_stats": stats.score_stats(),
+        "matchups": [(*result["strategies"], *result["scores"]) for result in results],
+        "metrics": results,
+        "violations": {name: stats.violations[name] for name in stats.strategies}
+    }
@@ -0,0 +1,13 @@
+import json
+import os
+import tempfile
+
+
+def write_json(path, data, **dump_options):
+    """Writes `data` to `path` as JSON atomically: readers see the old file or the new one, never a torn one."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as file:
+        json.dump(data, file, **dump_options)
+    os.replace(tmp_path, path)
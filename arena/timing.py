@@ -0,0 +1,72 @@
+import signal
+import threading
+from time import perf_counter
+
+
+class MoveTimeout(BaseException):
+    # Like KeyboardInterrupt, so a strategy's `except Exception:` cannot swallow the watchdog
+    pass
+
+
+def _raise_timeout(signum, frame):
+    raise MoveTimeout()
+
+
+class TimedPlayer:
+    """Int-protocol wrapper that holds a player to a per-call time budget.
+
+    play() and handle_moves() are timed with the monotonic perf_counter. A play()
+    that overruns has its move replaced by the penalty move; a handle_moves() that
+    overruns gets the player's next move replaced instead. Either way one violation
+    is counted. Python cannot pre-empt a call from the outside, so an overrun is
+    only noticed when the call returns; with a watchdog timeout (main thread, Unix
+    only) a SIGALRM interrupts calls that run past it, which then count as overruns.
+    An interrupted strategy may be left half-updated.
+    """
+
+    int_moves = True
+
+    def __init__(self, player, budget, penalty_move, watchdog_timeout=0.0):
+        self.name = player.name
+        self.budget = budget
+        self.penalty_move = penalty_move
+        self.violations = 0
+        self._play = player.play
+        self._handle_moves = player.handle_moves
+        self._penalize = False
+        self.watchdog_timeout = 0.0
+        if watchdog_timeout and hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread():
+            self.watchdog_timeout = watchdog_timeout
+
+    def _call(self, function, *args):
+        # Returns (result, overran)
+        start = perf_counter()
+        if not self.watchdog_timeout:
+            result = function(*args)
+            return result, perf_counter() - start > self.budget
+        # The SIGALRM handler is only ours for the duration of the call
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, self.watchdog_timeout)
+        try:
+            result = function(*args)
+        except MoveTimeout:
+            return None, True
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+        return result, perf_counter() - start > self.budget
+
+    def play(self):
+        move, overran = self._call(self._play)
+        if overran:
+            self.violations += 1
+        if overran or self._penalize:
+            self._penalize = False
+            return self.penalty_move
+        return move
+
+    def handle_moves(self, own_move, opponent_move):
+        _, overran = self._call(self._handle_moves, own_move, opponent_move)
+        if overran:
+            self.violations += 1
+            self._penalize = True
@@ -0,0 +1,124 @@
+import os
+from urllib.parse import quote, unquote
+
+import numpy as np
+
+from arena.observers import RoundObserver
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Index record of one game in a shard; the .idx file is a flat array of these
+INDEX_DTYPE = np.dtype([
+    ("game", "<i8"), ("offset", "<i8"), ("nbytes", "<i8"), ("rounds", "<i8"), ("compressed", "u1")
+])
+SHARD_SUFFIX = ".trace"
+INDEX_SUFFIX = ".idx"
+
+
+def pack_rounds(moves1, moves2):
+    """Packs two move sequences into 4 bits per round (3 * move1 + move2), two rounds per byte."""
+    codes = np.frombuffer(moves1, dtype=np.uint8) * np.uint8(3) + np.frombuffer(moves2, dtype=np.uint8)
+    if len(codes) % 2:
+        codes = np.append(codes, np.uint8(0))
+    return codes[0::2] | (codes[1::2] << 4)
+
+
+def unpack_rounds(packed, rounds, skip=0):
+    """(moves1, moves2) of `rounds` rounds from packed bytes, dropping the first `skip` nibbles."""
+    packed = np.asarray(packed, dtype=np.uint8)
+    codes = np.empty(2 * len(packed), dtype=np.uint8)
+    codes[0::2] = packed & 0x0F
+    codes[1::2] = packed >> 4
+    codes = codes[skip:skip + rounds]
+    return codes // 3, codes % 3
+
+
+def _shard_stem(strategy1_name, strategy2_name):
+    # Percent-quoting keeps any strategy name filesystem-safe and reversible; "+" is always quoted
+    return f"{quote(strategy1_name, safe='')}+{quote(strategy2_name, safe='')}"
+
+
+class TraceRecorder(RoundObserver):
+    """Writes every observed game's rounds to per-matchup shard files under `directory`.
+
+    Each game is one frame of packed rounds (see pack_rounds), 4 bits per round,
+    appended to <matchup>.<pid>.trace, and one INDEX_DTYPE record in the sidecar
+    .idx file says where it sits. With compression="zstd" every frame is
+    compressed on its own, so a single game still reads back without touching the
+    rest of the shard. Files are appended to and closed per game, which keeps the
+    copies of the recorder in parallel workers independent and leaves nothing to
+    flush; the pid in the name keeps two processes from sharing a shard.
+    """
+
+    def __init__(self, directory, compression=None):
+        if compression not in (None, "zstd"):
+            raise ValueError(f"unknown trace compression {compression!r}")
+        if compression and zstandard is None:
+            raise ImportError("trace_compression: zstd needs the zstandard package")
+        self.directory = directory
+        self.compression = compression
+        os.makedirs(directory, exist_ok=True)
+
+    def on_game(self, strategy1_name, strategy2_name, game_index, moves1, moves2):
+        frame = pack_rounds(moves1, moves2).tobytes()
+        if self.compression:
+            frame = zstandard.ZstdCompressor().compress(frame)
+        path = os.path.join(self.directory, f"{_shard_stem(strategy1_name, strategy2_name)}.{os.getpid()}")
+        with open(path + SHARD_SUFFIX, "ab") as shard:
+            offset = shard.tell()
+            shard.write(frame)
+        record = np.array([(game_index, offset, len(frame), len(moves1), bool(self.compression))], dtype=INDEX_DTYPE)
+        with open(path + INDEX_SUFFIX, "ab") as index:
+            index.write(record.tobytes())
+
+
+class TraceReader:
+    """Reads traces written by TraceRecorder, one game (or a slice of one) at a time.
+
+    Uncompressed shards are memory-mapped, so a slice of rounds only touches the
+    bytes it covers. If a game was recorded more than once, the most recently
+    written shard wins.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.index = {}  # (name1, name2) -> {game: (shard path, offset, nbytes, rounds, compressed)}
+        self._maps = {}
+        index_paths = [
+            os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(INDEX_SUFFIX)
+        ]
+        for index_path in sorted(index_paths, key=os.path.getmtime):
+            stem, _ = os.path.splitext(index_path)
+            quoted1, _, quoted2 = os.path.basename(stem).rsplit(".", 1)[0].partition("+")
+            games = self.index.setdefault((unquote(quoted1), unquote(quoted2)), {})
+            for game, offset, nbytes, rounds, compressed in np.fromfile(index_path, dtype=INDEX_DTYPE).tolist():
+                games[game] = (stem + SHARD_SUFFIX, offset, nbytes, rounds, compressed)
+
+    def matchups(self):
+        return sorted(self.index)
+
+    def games(self, strategy1_name, strategy2_name):
+        return sorted(self.index.get((strategy1_name, strategy2_name), ()))
+
+    def _map(self, path):
+        if path not in self._maps:
+            self._maps[path] = np.memmap(path, dtype=np.uint8, mode="r")
+        return self._maps[path]
+
+    def moves(self, strategy1_name, strategy2_name, game_index, start=0, stop=None):
+        """The two players' moves (uint8 arrays) in rounds start .. stop - 1 of one game."""
+        path, offset, nbytes, rounds, compressed = self.index[strategy1_name, strategy2_name][game_index]
+        start, stop, _ = slice(start, stop).indices(rounds)
+        count = max(0, stop - start)
+        if count == 0:
+            return np.empty(0, dtype=np.uint8), np.empty(0, dtype=np.uint8)
+        if compressed:
+            if zstandard is None:
+                raise ImportError("reading zstd-compressed traces needs the zstandard package")
+            frame = zstandard.ZstdDecompressor().decompress(bytes(self._map(path)[offset:offset + nbytes]))
+            return unpack_rounds(np.frombuffer(frame, dtype=np.uint8), count, start)
+        first, last = offset + start // 2, offset + (stop + 1) // 2
+        return unpack_rounds(self._map(path)[first:last], count, start % 2)
@@ -0,0 +1,232 @@
+import json
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from arena.cache import engine_fingerprint
+from arena.stats import TournamentStats
+from arena.specs import StrategySpec
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS tasks (
+    position INTEGER,
+    name1 TEXT, name2 TEXT,
+    spec1 TEXT, spec2 TEXT,
+    status TEXT DEFAULT 'pending',
+    worker TEXT,
+    lease_until REAL,
+    totals TEXT,
+    games TEXT,
+    PRIMARY KEY (name1, name2)
+);
+"""
+
+
+def _spec_to_json(strategy_class):
+    spec = StrategySpec.from_class(strategy_class)
+    return json.dumps({"module": spec.module, "qualname": spec.qualname, "kwargs": spec.kwargs, "name": spec._name})
+
+
+def _spec_from_json(text):
+    return StrategySpec(**json.loads(text))
+
+
+class TournamentQueue:
+    """Round-robin matchups in a SQLite file that several hosts work through without a broker.
+
+    Agents claim one matchup at a time under a lease, which they renew while the
+    matchup plays; a lease that runs out (the agent died or its host went away)
+    makes the matchup claimable again, and only the agent holding a matchup's lease
+    can complete it. Put the file on storage whose locking SQLite trusts (a local
+    disk shared over a cluster filesystem, not a plain NFS mount).
+    """
+
+    def __init__(self, path, timeout=60.0):
+        self.path = path
+        self.db = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def submit(self, engine, strategy_classes):
+        """Queues every pairing of strategy_classes.
+
+        Pairs already queued keep their status and results; pairs of an earlier
+        roster that are not in this one are dropped, and so is everything when the
+        engine settings or code changed since the last submit.
+        """
+        fingerprint = json.dumps(engine_fingerprint(engine), sort_keys=True)
+        pairs = engine.round_robin_pairs(strategy_classes)
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.db.execute("SELECT value FROM meta WHERE key = 'engine'").fetchone()
+            if row is None or row[0] != fingerprint:
+                self.db.execute("DELETE FROM tasks")
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('engine', ?)", (fingerprint,))
+            self.db.execute("CREATE TEMP TABLE roster (name1 TEXT, name2 TEXT)")
+            self.db.executemany("INSERT INTO roster VALUES (?, ?)", [(s1.name, s2.name) for s1, s2 in pairs])
+            self.db.execute("DELETE FROM tasks WHERE (name1, name2) NOT IN (SELECT name1, name2 FROM roster)")
+            self.db.execute("DROP TABLE roster")
+            for position, (s1_cls, s2_cls) in enumerate(pairs):
+                self.db.execute(
+                    "INSERT INTO tasks (position, name1, name2, spec1, spec2) VALUES (?, ?, ?, ?, ?)"
+                    " ON CONFLICT (name1, name2) DO UPDATE SET position = excluded.position",
+                    (position, s1_cls.name, s2_cls.name, _spec_to_json(s1_cls), _spec_to_json(s2_cls))
+                )
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+
+    def check_engine(self, engine):
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'engine'").fetchone()
+        if row is None or json.loads(row[0]) != engine_fingerprint(engine):
+            raise ValueError(f"{self.path}: queued with different engine settings or code than this host's")
+
+    def claim(self, worker, lease_seconds):
+        """Leases the first pending or expired matchup to `worker`; returns (name1, name2, spec1, spec2) or None."""
+        now = time.time()
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.db.execute(
+                "SELECT name1, name2, spec1, spec2 FROM tasks"
+                " WHERE status = 'pending' OR (status = 'leased' AND lease_until < ?)"
+                " ORDER BY position LIMIT 1",
+                (now,)
+            ).fetchone()
+            if row is not None:
+                self.db.execute(
+                    "UPDATE tasks SET status = 'leased', worker = ?, lease_until = ? WHERE name1 = ? AND name2 = ?",
+                    (worker, now + lease_seconds, row[0], row[1])
+                )
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        if row is None:
+            return None
+        return row[0], row[1], _spec_from_json(row[2]), _spec_from_json(row[3])
+
+    def renew(self, name1, name2, worker, lease_seconds):
+        """Extends `worker`'s lease on a matchup; returns False if the lease was lost to another agent."""
+        cursor = self.db.execute(
+            "UPDATE tasks SET lease_until = ? WHERE name1 = ? AND name2 = ? AND worker = ? AND status = 'leased'",
+            (time.time() + lease_seconds, name1, name2, worker)
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, name1, name2, worker, totals, games=()):
+        """Stores the totals and per-game results of a matchup leased to `worker`; returns False if the lease was lost."""
+        cursor = self.db.execute(
+            "UPDATE tasks SET status = 'done', totals = ?, games = ?, lease_until = NULL"
+            " WHERE name1 = ? AND name2 = ? AND worker = ? AND status = 'leased'",
+            (json.dumps(totals), json.dumps(games), name1, name2, worker)
+        )
+        return cursor.rowcount == 1
+
+    def progress(self):
+        """Counts of matchups per status, e.g. {"pending": 3, "leased": 2, "done": 40}."""
+        return dict(self.db.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall())
+
+    def finished(self):
+        """(name1, name2, totals, games) of every completed matchup, in roster order."""
+        rows = self.db.execute(
+            "SELECT name1, name2, totals, games FROM tasks WHERE status = 'done' ORDER BY position"
+        ).fetchall()
+        return [
+            (
+                name1, name2,
+                {k: tuple(v) if isinstance(v, list) else v for k, v in json.loads(totals).items()},
+                json.loads(games or "[]")
+            )
+            for name1, name2, totals, games in rows
+        ]
+
+
+@contextmanager
+def _lease_heartbeat(path, name1, name2, worker, lease_seconds):
+    """Renews a lease every third of lease_seconds while the body runs, so a long matchup is not reclaimed."""
+    stop = threading.Event()
+
+    def beat():
+        # SQLite connections stay on the thread that opened them
+        queue = TournamentQueue(path)
+        try:
+            while not stop.wait(lease_seconds / 3):
+                queue.renew(name1, name2, worker, lease_seconds)
+        finally:
+            queue.close()
+
+    thread = threading.Thread(target=beat, name="lease-heartbeat", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def run_agent(path, engine=None, worker=None, lease_seconds=None, poll_interval=5.0):
+    """Plays matchups from the queue at `path` until none are left; returns how many this agent finished.
+
+    While other agents still hold leases the agent keeps polling, so it can pick up
+    their matchups if they die.
+    """
+    if engine is None:
+        from arena.game_engine import GameEngine
+        engine = GameEngine()
+    worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+    lease_seconds = engine.LEASE_SECONDS if lease_seconds is None else lease_seconds
+    queue = TournamentQueue(path)
+    played = 0
+    try:
+        queue.check_engine(engine)
+        while True:
+            task = queue.claim(worker, lease_seconds)
+            if task is None:
+                if not queue.progress().get("leased"):
+                    return played
+                time.sleep(poll_interval)
+                continue
+            name1, name2, spec1, spec2 = task
+            with _lease_heartbeat(path, name1, name2, worker, lease_seconds):
+                games = engine.play_matchup_games(spec1, spec2)
+            if queue.complete(name1, name2, worker, engine.tally_games(games), games):
+                played += 1
+    finally:
+        queue.close()
+
+
+def collect_tournament(engine, strategy_classes, path, poll_interval=5.0, reporter=None):
+    """Waits for the queue at `path` to drain and merges it into the usual round_robin_tournament result.
+
+    The agents' engines have no event bus, so the per-game results they stored are
+    reported from here: ratings and NDJSON logs see every game, as in a local run.
+    """
+    queue = TournamentQueue(path)
+    try:
+        while set(queue.progress()) - {"done"}:
+            time.sleep(poll_interval)
+        finished = queue.finished()
+    finally:
+        queue.close()
+    previous = {"metrics": [engine.matchup_result(name1, name2, totals) for name1, name2, totals, _ in finished]}
+    pairs = engine.round_robin_pairs(strategy_classes)
+    stats = TournamentStats(engine.NUM_GAMES_PER_MATCH)
+    with engine.reporting(reporter) as events:
+        for name1, name2, _, games in finished:
+            engine.report_games(name1, name2, games)
+        results = list(engine._iter_pairs(pairs, None, stats, previous, events, engine.open_checkpoint()))
+        engine.report_finished(events, stats, len(pairs))
+    return engine.tournament_results(stats, results)
+
+
+if __name__ == "__main__":
+    # python -m arena.workqueue QUEUE_FILE [WORKER_ID]
+    print(f"Finished {run_agent(sys.argv[1], worker=sys.argv[2] if len(sys.argv) > 2 else None)} matchups")
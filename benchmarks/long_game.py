@@ -0,0 +1,53 @@
+"""Peak memory of single long games, for checking that strategies' memory stays flat.
+
+    python -m benchmarks.long_game [MAX_ROUNDS]
+
+Plays one game per pair at 10^4, 10^5, ... up to MAX_ROUNDS rounds (default 10^7)
+with cycle fast-forwarding off, so every round is really played, and prints the
+process's peak RSS after each. Game lengths only grow, so a flat peak means the
+memory of a game does not depend on its length.
+"""
+import resource
+import sys
+import time
+
+from arena.game_engine import GameEngine
+from strategies.adaptiveswitcher_strategy import AdaptiveSwitcherStrategy
+from strategies.enhanceddelay_strategy import EnhancedStrategyDelay
+from strategies.frequency_strategy import FrequencyStrategy
+from strategies.secondordermarkov_strategy import SecondOrderMarkov
+from strategies.shinydiamond_strategy import ShinyDiamond
+
+PAIRS = [
+    (FrequencyStrategy, SecondOrderMarkov),
+    (EnhancedStrategyDelay, AdaptiveSwitcherStrategy),
+    (ShinyDiamond, FrequencyStrategy),
+]
+
+
+def peak_rss_mib():
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    max_rounds = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10_000_000
+    engine = GameEngine()
+    engine.SEED = 0
+    engine.FAST_FORWARD_CYCLES = False
+
+    print(f"{'pair':<50} {'rounds':>10} {'seconds':>9} {'us/round':>9} {'peak MiB':>9}")
+    for strategy1_class, strategy2_class in PAIRS:
+        rounds = 10_000
+        while rounds <= max_rounds:
+            engine.NUM_PLAYS_PER_GAME = rounds
+            start = time.perf_counter()
+            engine.play_distinct_games(strategy1_class, strategy2_class, 1)
+            seconds = time.perf_counter() - start
+            pair = f"{strategy1_class.name} vs {strategy2_class.name}"
+            print(f"{pair:<50} {rounds:>10} {seconds:>9.1f} {seconds / rounds * 1e6:>9.2f} {peak_rss_mib():>9.1f}", flush=True)
+            rounds *= 10
+
+
+if __name__ == "__main__":
+    main()
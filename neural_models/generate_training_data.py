@@ -5,6 +5,7 @@ import random
 import csv
 from collections import deque
 from arena.game_engine import GameEngine
+from arena.moves import as_int_strategy
 from strategies.random_strategy import RandomStrategy
 from strategies.enhanced_strategy import EnhancedStrategy
 from strategies.cycle_strategy import CycleStrategy
@@ -32,8 +33,6 @@ WINDOW_SIZE = 4
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_CSV = os.path.join(BASE_DIR, "training_data.csv")
 
-move_to_idx = {"rock": 0, "paper": 1, "scissors": 2}
-
 strategies = [
     RandomStrategy,                  # For baseline unpredictability
     CycleStrategy,                   # For loop pattern detection
@@ -63,8 +62,9 @@ for i in range(len(strategies)):
         s2_cls = strategies[j]
 
         for _ in range(NUM_GAMES_PER_MATCH):
-            s1 = s1_cls()
-            s2 = s2_cls()
+            # Integer moves double as the training-data encoding (0=rock, 1=paper, 2=scissors)
+            s1 = as_int_strategy(s1_cls())
+            s2 = as_int_strategy(s2_cls())
             history = deque(maxlen=WINDOW_SIZE)
 
             for _ in range(NUM_PLAYS_PER_GAME):
@@ -74,8 +74,8 @@ for i in range(len(strategies)):
                 if len(history) == WINDOW_SIZE:
                     row = []
                     for prev_move1, prev_move2 in history:
-                        row.extend([move_to_idx[prev_move1], move_to_idx[prev_move2]])
-                    row.append(move_to_idx[move2])  # Target: opponent's move
+                        row.extend([prev_move1, prev_move2])
+                    row.append(move2)  # Target: opponent's move
                     dataset.append(row)
 
                 history.append((move1, move2))
@@ -1,15 +1,17 @@
 from strategies.cycle_strategy import CycleStrategy
 from strategies.lastn_strategy import LastNStrategy
 from strategies.frequency_strategy import FrequencyStrategy
+from arena.moves import SCORE_DELTA
 
 class AdaptiveSwitcherStrategy:
     name = "AdaptiveSwitcherStrategy"
+    deterministic = True
 
     def __init__(self):
         self.strategies = [CycleStrategy(), FrequencyStrategy(), LastNStrategy()]
         self.performance = [0] * len(self.strategies)
         self.current_index = 0
-        self.history = []
+        self.rounds = 0
 
     def play(self):
         return self.strategies[self.current_index].play()
@@ -17,10 +19,9 @@ class AdaptiveSwitcherStrategy:
     def handle_moves(self, my_move, opponent_move):
         for strat in self.strategies:
             strat.handle_moves(my_move, opponent_move)
-        self.history.append((my_move, opponent_move))
-        if len(self.history) > 10:
-            my, opp = self.history[-1]
-            if self._win(my, opp):
+        self.rounds += 1
+        if self.rounds > 10:
+            if self._win(my_move, opponent_move):
                 self.performance[self.current_index] += 1
             else:
                 self.performance[self.current_index] -= 1
@@ -29,6 +30,4 @@ class AdaptiveSwitcherStrategy:
                 self.performance[self.current_index] = 0
 
     def _win(self, a, b):
-        return (a == "rock" and b == "scissors") or \
-               (a == "paper" and b == "rock") or \
-               (a == "scissors" and b == "paper")
+        return SCORE_DELTA[a, b] == 1
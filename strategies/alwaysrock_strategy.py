@@ -1,8 +1,25 @@
+from arena.markov import mixed_policy
+from arena.moves import ROCK
+
 class AlwaysRockStrategy:
     name = "AlwaysRockStrategy"
+    deterministic = True
+    int_moves = True
 
     def play(self):
-        return "rock"
+        return ROCK
 
     def handle_moves(self, own_move, opponent_move):
-        pass
\ No newline at end of file
+        pass
+
+    def state_key(self):
+        return ()
+
+    def markov_initial_state(self):
+        return None
+
+    def markov_policy(self, state):
+        return mixed_policy(ROCK, 1.0)
+
+    def markov_next_state(self, state, own_move, opponent_move):
+        return None
@@ -3,6 +3,8 @@ from collections import defaultdict, Counter
 from strategies.markov_strategy import MarkovStrategy
 from strategies.qlearning_strategy import QLearningStrategy
 from strategies.enhanced_strategy import EnhancedStrategy
+from arena.moves import COUNTER_MOVE, SCORE_DELTA
+from arena.history import RingHistory
 
 class AntiMetaV4_MirrorDiverge:
     name = "AntiMetaV4_MirrorDiverge"
@@ -19,8 +21,8 @@ class AntiMetaV4_MirrorDiverge:
         self.last_used = None
         self.last_state = None
 
-        self.opp_history = []
-        self.my_history = []
+        self.opp_history = RingHistory(maxlen=2)
+        self.my_history = RingHistory(maxlen=2)
         self.move_counts = Counter()
 
         self.mirror_score = 0
@@ -84,16 +86,7 @@ class AntiMetaV4_MirrorDiverge:
         )
 
     def get_score_delta(self, move1, move2):
-        if move1 == move2:
-            return 0
-        elif (
-            (move1 == "rock" and move2 == "scissors") or
-            (move1 == "scissors" and move2 == "paper") or
-            (move1 == "paper" and move2 == "rock")
-        ):
-            return 1
-        else:
-            return -1
+        return SCORE_DELTA[move1, move2]
 
     def get_profiled_state(self):
         total = sum(self.move_counts.values())
@@ -103,4 +96,4 @@ class AntiMetaV4_MirrorDiverge:
         return (bias_level, self.diverge_mode)
 
     def counter_move(self, move):
-        return {"rock": "paper", "paper": "scissors", "scissors": "rock"}[move]
+        return COUNTER_MOVE[move]
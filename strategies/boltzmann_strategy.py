@@ -4,6 +4,7 @@ from collections import defaultdict
 from strategies.markov_strategy import MarkovStrategy
 from strategies.qlearning_strategy import QLearningStrategy
 from strategies.enhanced_strategy import EnhancedStrategy
+from arena.moves import SCORE_DELTA
 
 
 class BoltzmannMetaStrategy:
@@ -66,13 +67,4 @@ class BoltzmannMetaStrategy:
         self.stats[self.last_used]["count"] += 1
 
     def get_score_delta(self, move1, move2):
-        if move1 == move2:
-            return 0
-        elif (
-            (move1 == "rock" and move2 == "scissors") or
-            (move1 == "scissors" and move2 == "paper") or
-            (move1 == "paper" and move2 == "rock")
-        ):
-            return 1
-        else:
-            return -1
+        return SCORE_DELTA[move1, move2]
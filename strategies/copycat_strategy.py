@@ -15,3 +15,7 @@ class CopycatStrategy:
 
     def handle_moves(self, own_move, opponent_move):
         self.opponent_history.append(opponent_move)
+
+    def state_key(self):
+        # Only the opening move is random; after it, play depends on the last opponent move alone
+        return self.opponent_history[-1] if self.opponent_history else None
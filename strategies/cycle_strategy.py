@@ -1,5 +1,24 @@
+import numpy as np
+from arena.markov import mixed_policy
+
+
+class CycleStrategyBatch:
+    def __init__(self, rngs):
+        self.index = np.zeros(len(rngs), dtype=np.int8)
+
+    def play_batch(self):
+        moves = self.index.copy()
+        self.index = (self.index + 1) % 3
+        return moves
+
+    def handle_moves_batch(self, own_moves, opponent_moves):
+        pass
+
+
 class CycleStrategy:
     name = "CycleStrategy"
+    deterministic = True
+    batch_class = CycleStrategyBatch
 
     def __init__(self):
         self.moves = ["rock", "paper", "scissors"]
@@ -11,4 +30,16 @@ class CycleStrategy:
         return move
 
     def handle_moves(self, own_move, opponent_move):
-        pass
\ No newline at end of file
+        pass
+
+    def state_key(self):
+        return self.index
+
+    def markov_initial_state(self):
+        return self.index
+
+    def markov_policy(self, state):
+        return mixed_policy(state, 1.0)
+
+    def markov_next_state(self, state, own_move, opponent_move):
+        return (state + 1) % 3
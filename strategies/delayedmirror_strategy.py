@@ -6,13 +6,19 @@ class DelayedMirrorStrategy:
 
     def __init__(self, delay=2):
         self.delay = delay
-        self.opponent_history = deque(maxlen=100)
+        # Only the last `delay` moves are ever read, so that is all that is kept
+        self.opponent_history = deque(maxlen=delay)
 
     def play(self):
         if len(self.opponent_history) >= self.delay:
-            return self.opponent_history[-self.delay]
+            return self.opponent_history[0]
         else:
             return random.choice(["rock", "paper", "scissors"])
 
     def handle_moves(self, my_move, opponent_move):
         self.opponent_history.append(opponent_move)
+
+    def state_key(self):
+        if len(self.opponent_history) < self.delay:
+            return None
+        return tuple(self.opponent_history)
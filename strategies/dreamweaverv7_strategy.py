@@ -4,6 +4,8 @@ from collections import defaultdict, Counter
 from strategies.markov_strategy import MarkovStrategy
 from strategies.qlearning_strategy import QLearningStrategy
 from strategies.enhanced_strategy import EnhancedStrategy
+from arena.moves import SCORE_DELTA
+from arena.history import RingHistory
 
 
 class DreamWeaverV7:
@@ -20,14 +22,14 @@ class DreamWeaverV7:
         self.q_table = defaultdict(lambda: {a: 0.0 for a in self.actions})
         self.last_sa = None
 
-        self.opp_history = []
+        self.opp_history = RingHistory(maxlen=20)
         self.move_counts = Counter()
         self.move_repeats = 0
         self.move_transitions = 0
 
-        self.strategy_history = []
         self.pattern_threshold = 8
         self.pattern_window = 10
+        self.strategy_history = RingHistory(maxlen=self.pattern_window)
 
         self.learning_rate = 0.2
         self.discount_factor = 0.9
@@ -101,14 +103,7 @@ class DreamWeaverV7:
         self.epsilon = max(0.01, self.epsilon * 0.995)
 
     def get_score_delta(self, move1: str, move2: str) -> int:
-        if move1 == move2:
-            return 0
-        elif (move1 == "rock" and move2 == "scissors") or \
-             (move1 == "scissors" and move2 == "paper") or \
-             (move1 == "paper" and move2 == "rock"):
-            return 1
-        else:
-            return -1
+        return SCORE_DELTA[move1, move2]
 
     def get_profiled_state(self) -> tuple:
         recent_repeat = int(
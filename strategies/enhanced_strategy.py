@@ -1,21 +1,25 @@
 import random
+from arena.moves import COUNTER_MOVE
 
 class EnhancedStrategy:
     name = "EnhancedStrategy"
 
     def __init__(self):
-        self.history = []
+        self.last_opponent_move = None
 
     def play(self) -> str:
-        if not self.history:
+        if self.last_opponent_move is None:
             return random.choice(["rock", "paper", "scissors"])
 
-        last_opponent_move = self.history[-1][1]
-        return self.counter_move(last_opponent_move)
+        return self.counter_move(self.last_opponent_move)
 
     def handle_moves(self, own_move: str, opponent_move: str):
-        self.history.append((own_move, opponent_move))
+        self.last_opponent_move = opponent_move
+
+    def state_key(self):
+        return self.last_opponent_move
 
     def counter_move(self, move: str) -> str:
-        counter = {"rock": "paper", "paper": "scissors", "scissors": "rock"}
-        return counter.get(move, random.choice(["rock", "paper", "scissors"]))
+        if move in COUNTER_MOVE:
+            return COUNTER_MOVE[move]
+        return random.choice(["rock", "paper", "scissors"])
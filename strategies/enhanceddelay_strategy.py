@@ -1,23 +1,21 @@
 import random
 import math
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, deque
+from arena.markov import UNIFORM, mixed_policy
+from arena.moves import COUNTER, COUNTER_MOVE
 
 
 class EnhancedStrategyDelay:
     name = "EnhancedStrategy"
 
     def __init__(self, delay=0, response_chance=0.8):
-        self.history = []
+        self.history = deque(maxlen=delay + 1)
         self.delay = delay
         self.response_chance = response_chance
 
     def counter_move(self, move):
-        if move == "rock":
-            return "paper"
-        elif move == "paper":
-            return "scissors"
-        elif move == "scissors":
-            return "rock"
+        if move in COUNTER_MOVE:
+            return COUNTER_MOVE[move]
         return random.choice(["rock", "paper", "scissors"])
 
     def play(self):
@@ -29,3 +27,15 @@ class EnhancedStrategyDelay:
 
     def handle_moves(self, own_move, opponent_move):
         self.history.append((own_move, opponent_move))
+
+    # State: the opponent's last delay + 1 moves (fewer during the first rounds)
+    def markov_initial_state(self):
+        return ()
+
+    def markov_policy(self, state):
+        if len(state) <= self.delay:
+            return UNIFORM
+        return mixed_policy(COUNTER[state[0]], self.response_chance)
+
+    def markov_next_state(self, state, own_move, opponent_move):
+        return (state + (opponent_move,))[-(self.delay + 1):]
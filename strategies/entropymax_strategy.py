@@ -1,6 +1,7 @@
 import random
 from collections import deque
 import math
+from arena.moves import COUNTER_MOVE
 
 class EntropyMaximizerStrategy:
     name = "EntropyMaximizerStrategy"
@@ -31,11 +32,7 @@ class EntropyMaximizerStrategy:
         return max(counts, key=counts.get)
 
     def counter(self, move):
-        return {
-            "rock": "paper",
-            "paper": "scissors",
-            "scissors": "rock"
-        }[move]
+        return COUNTER_MOVE[move]
 
     def calculate_entropy(self):
         counts = {"rock": 0, "paper": 0, "scissors": 0}
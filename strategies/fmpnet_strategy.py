@@ -3,6 +3,7 @@ import torch
 import random
 from collections import deque
 import torch.nn as nn
+from arena.moves import COUNTER_MOVE
 
 # Define model architecture
 class RPSNet(nn.Module):
@@ -58,4 +59,4 @@ class FMPNetStrategy:
         self.history.append((my_move, opponent_move))
 
     def counter(self, move):
-        return {"rock": "paper", "paper": "scissors", "scissors": "rock"}[move]
+        return COUNTER_MOVE[move]
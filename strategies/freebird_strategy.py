@@ -7,6 +7,8 @@ from strategies.enhanceddelay_strategy import EnhancedStrategyDelay
 from strategies.bayesian_strategy import BayesianNGramStrategy
 from strategies.mcts_strategy import MCTSStrategyUCB
 from strategies.noiseinjection_strategy import NoiseInjectionStrategy
+from arena.moves import SCORE_DELTA
+from arena.history import RingHistory
 
 
 class FreeBird:
@@ -26,8 +28,9 @@ class FreeBird:
         self.q_table = defaultdict(lambda: {a: 0.0 for a in self.actions})
         self.last_sa = None
 
-        self.opp_history = []
+        self.opp_history = RingHistory(maxlen=2)
         self.move_counts = Counter()
+        self.move_transitions = 0
         self.strategy_streaks = defaultdict(int)
         self.current_streak_strategy = None
 
@@ -77,6 +80,8 @@ class FreeBird:
         for strat in self.strategies.values():
             strat.handle_moves(my_move, opponent_move)
 
+        if self.opp_history and opponent_move != self.opp_history[-1]:
+            self.move_transitions += 1
         self.opp_history.append(opponent_move)
         self.move_counts[opponent_move] += 1
 
@@ -94,14 +99,7 @@ class FreeBird:
         self.epsilon = max(0.01, self.epsilon * 0.995)
 
     def get_score_delta(self, move1, move2):
-        if move1 == move2:
-            return 0
-        elif (move1 == "rock" and move2 == "scissors") or \
-             (move1 == "scissors" and move2 == "paper") or \
-             (move1 == "paper" and move2 == "rock"):
-            return 1
-        else:
-            return -1
+        return SCORE_DELTA[move1, move2]
 
     def get_profiled_state(self):
         recent_repeat = int(len(self.opp_history) >= 2 and self.opp_history[-1] == self.opp_history[-2])
@@ -115,7 +113,7 @@ class FreeBird:
                 bias_level = 2
             elif bias_ratio > 0.4:
                 bias_level = 1
-            switch_rate = sum(self.opp_history[i] != self.opp_history[i - 1] for i in range(1, len(self.opp_history))) / total
+            switch_rate = self.move_transitions / total
 
         switch_bucket = 2 if switch_rate > 0.6 else 1 if switch_rate > 0.3 else 0
         return (recent_repeat, bias_level, switch_bucket)
\ No newline at end of file
@@ -1,21 +1,43 @@
+import numpy as np
+from arena.batch import COUNTER_TABLE
+from arena.moves import COUNTER_MOVE, MOVES
+
+
+class FrequencyStrategyBatch:
+    def __init__(self, rngs):
+        self.counts = np.zeros((len(rngs), 3), dtype=np.int64)
+        self.games = np.arange(len(rngs))
+        self.seen = False
+
+    def play_batch(self):
+        if not self.seen:
+            return np.zeros(len(self.games), dtype=np.int8)
+        return COUNTER_TABLE[self.counts.argmax(axis=1)]
+
+    def handle_moves_batch(self, own_moves, opponent_moves):
+        self.counts[self.games, opponent_moves] += 1
+        self.seen = True
+
+
 class FrequencyStrategy:
     name = "FrequencyStrategy"
+    deterministic = True
+    batch_class = FrequencyStrategyBatch
 
     def __init__(self):
-        self.opponent_moves = []
+        self.opponent_counts = dict.fromkeys(MOVES, 0)
+        self.seen = False
 
     def play(self):
-        if not self.opponent_moves:
+        if not self.seen:
             return "rock"
-        most_common = max(set(self.opponent_moves), key=self.opponent_moves.count)
+        # Ties go to the earliest of rock/paper/scissors, not to (hash-seeded) set order
+        most_common = max(MOVES, key=self.opponent_counts.get)
         return self.counter(most_common)
 
     def handle_moves(self, my_move, opponent_move):
-        self.opponent_moves.append(opponent_move)
+        self.opponent_counts[opponent_move] += 1
+        self.seen = True
 
     def counter(self, move):
-        return {
-            "rock": "paper",
-            "paper": "scissors",
-            "scissors": "rock"
-        }[move]
+        return COUNTER_MOVE[move]
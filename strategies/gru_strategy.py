@@ -5,6 +5,7 @@ import torch
 import torch.nn as nn
 import random
 from collections import deque
+from arena.moves import COUNTER_MOVE
 
 # Define the GRU model (must match training architecture)
 class GRURPSNet(nn.Module):
@@ -54,4 +55,4 @@ class GRUStrategy:
         self.history.append((my_move, opponent_move))
 
     def counter(self, move):
-        return {"rock": "paper", "paper": "scissors", "scissors": "rock"}[move]
+        return COUNTER_MOVE[move]
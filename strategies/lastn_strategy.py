@@ -1,19 +1,26 @@
+from collections import deque
+from arena.moves import COUNTER_MOVE, MOVES
+
 class LastNStrategy:
     name = "LastNStrategy"
+    deterministic = True
 
     def __init__(self, n=3):
-        self.memory = []
+        self.memory = deque(maxlen=n)
         self.n = n
 
     def play(self):
         if not self.memory:
             return "rock"
-        window = self.memory[-self.n:]
-        most_common = max(set(window), key=window.count)
+        # Ties go to the earliest of rock/paper/scissors, not to (hash-seeded) set order
+        most_common = max(MOVES, key=self.memory.count)
         return self.counter(most_common)
 
     def handle_moves(self, my_move, opponent_move):
         self.memory.append(opponent_move)
 
+    def state_key(self):
+        return tuple(self.memory)
+
     def counter(self, move):
-        return {"rock": "paper", "paper": "scissors", "scissors": "rock"}[move]
+        return COUNTER_MOVE[move]
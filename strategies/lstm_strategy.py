@@ -3,6 +3,7 @@ import torch
 import random
 import torch.nn as nn
 from collections import deque
+from arena.moves import COUNTER_MOVE
 
 # --- Re-define the model architecture ---
 class LSTMRPSNet(nn.Module):
@@ -52,4 +53,4 @@ class LSTMStrategy:
         self.history.append((my_move, opponent_move))
 
     def counter(self, move):
-        return {"rock": "paper", "paper": "scissors", "scissors": "rock"}[move]
+        return COUNTER_MOVE[move]
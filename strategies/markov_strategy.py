@@ -1,8 +1,46 @@
 import random
 from collections import defaultdict
+import numpy as np
+from arena.batch import COUNTER_TABLE, MOVE_CODES
+from arena.moves import COUNTER_MOVE
+
+
+class MarkovStrategyBatch:
+    def __init__(self, rngs):
+        size = len(rngs)
+        self.rngs = rngs
+        self.transition_counts = np.zeros((size, 3, 3), dtype=np.int64)
+        # Round in which each transition was first seen; the scalar strategy breaks ties by that order
+        self.first_seen = np.zeros((size, 3, 3), dtype=np.int64)
+        self.last_move = np.full(size, -1, dtype=np.int8)
+        self.games = np.arange(size)
+        self.round = 0
+
+    def play_batch(self):
+        moves = np.zeros(len(self.games), dtype=np.int8)
+        known = self.last_move >= 0
+        rows = self.transition_counts[self.games, self.last_move]
+        seen = known & rows.any(axis=1)
+        if seen.any():
+            ranked = rows[seen] * (1 << 32) - self.first_seen[self.games[seen], self.last_move[seen]]
+            moves[seen] = COUNTER_TABLE[ranked.argmax(axis=1)]
+        for game in np.flatnonzero(~seen).tolist():
+            moves[game] = self.rngs[game].choice(MOVE_CODES)
+        return moves
+
+    def handle_moves_batch(self, own_moves, opponent_moves):
+        known = self.last_move >= 0
+        games, last, opp = self.games[known], self.last_move[known], opponent_moves[known]
+        new = self.transition_counts[games, last, opp] == 0
+        self.first_seen[games[new], last[new], opp[new]] = self.round
+        self.transition_counts[games, last, opp] += 1
+        self.last_move = opponent_moves.copy()
+        self.round += 1
+
 
 class MarkovStrategy:
     name = "MarkovStrategy"
+    batch_class = MarkovStrategyBatch
 
     def __init__(self):
         self.transition_counts = defaultdict(lambda: defaultdict(int))
@@ -23,4 +61,4 @@ class MarkovStrategy:
         self.last_move = opponent_move
 
     def counter(self, move):
-        return {"rock": "paper", "paper": "scissors", "scissors": "rock"}[move]
+        return COUNTER_MOVE[move]
@@ -1,6 +1,7 @@
 import random
 import math
 from collections import deque
+from arena.moves import SCORE_DELTA
 
 class MCTSStrategyUCB:
     name = "MCTSStrategyUCB"
@@ -69,14 +70,7 @@ class MCTSStrategyUCB:
         return my_score
 
     def score_round(self, my_move, opp_move):
-        if my_move == opp_move:
-            return 0
-        elif (my_move == "rock" and opp_move == "scissors") or \
-             (my_move == "scissors" and opp_move == "paper") or \
-             (my_move == "paper" and opp_move == "rock"):
-            return 1
-        else:
-            return -1
+        return SCORE_DELTA[my_move, opp_move]
 
     def handle_moves(self, own_move, opponent_move):
         self.history.append((own_move, opponent_move))
@@ -3,6 +3,8 @@ from collections import defaultdict, Counter
 from strategies.markov_strategy import MarkovStrategy
 from strategies.qlearning_strategy import QLearningStrategy
 from strategies.enhanced_strategy import EnhancedStrategy
+from arena.moves import SCORE_DELTA
+from arena.history import RingHistory
 
 class MetaLearnerV5_QController:
     name = "MetaLearnerV5_QController"
@@ -18,7 +20,7 @@ class MetaLearnerV5_QController:
 
         self.last_used = None
         self.last_state = None
-        self.opp_history = []
+        self.opp_history = RingHistory(maxlen=2)
         self.move_counts = Counter()
 
         self.learning_rate = 0.2
@@ -60,16 +62,7 @@ class MetaLearnerV5_QController:
         )
 
     def get_score_delta(self, move1, move2):
-        if move1 == move2:
-            return 0
-        elif (
-            (move1 == "rock" and move2 == "scissors") or
-            (move1 == "scissors" and move2 == "paper") or
-            (move1 == "paper" and move2 == "rock")
-        ):
-            return 1
-        else:
-            return -1
+        return SCORE_DELTA[move1, move2]
 
     def get_state(self):
         # Opponent repeated last move?
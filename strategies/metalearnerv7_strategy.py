@@ -3,6 +3,8 @@ from collections import defaultdict, Counter
 from strategies.markov_strategy import MarkovStrategy
 from strategies.qlearning_strategy import QLearningStrategy
 from strategies.enhanced_strategy import EnhancedStrategy
+from arena.moves import SCORE_DELTA
+from arena.history import RingHistory
 
 class MetaLearnerV7_ShadowQ:
     name = "MetaLearnerV7_ShadowQ"
@@ -20,11 +22,11 @@ class MetaLearnerV7_ShadowQ:
         self.last_state = None
 
         # Profiling
-        self.opp_history = []
+        self.opp_history = RingHistory(maxlen=2)
         self.move_counts = Counter()
         self.move_repeats = 0
         self.move_transitions = 0
-        self.my_history = []
+        self.my_history = RingHistory(maxlen=2)
 
         # Strategy usage tracker
         self.strategy_usage = Counter()
@@ -116,16 +118,7 @@ class MetaLearnerV7_ShadowQ:
         )
 
     def get_score_delta(self, move1, move2):
-        if move1 == move2:
-            return 0
-        elif (
-            (move1 == "rock" and move2 == "scissors") or
-            (move1 == "scissors" and move2 == "paper") or
-            (move1 == "paper" and move2 == "rock")
-        ):
-            return 1
-        else:
-            return -1
+        return SCORE_DELTA[move1, move2]
 
     def get_profiled_state(self):
         recent_repeat = 1 if len(self.opp_history) >= 2 and self.opp_history[-1] == self.opp_history[-2] else 0
@@ -1,4 +1,5 @@
 import random
+from arena.moves import COUNTER_MOVE
 
 class MirrorBaiterStrategy:
     name = "MirrorBaiterStrategy"
@@ -37,11 +38,7 @@ class MirrorBaiterStrategy:
         self.opponent_last_move = opponent_move
 
     def counter(self, move):
-        return {
-            "rock": "paper",
-            "paper": "scissors",
-            "scissors": "rock"
-        }[move]
+        return COUNTER_MOVE[move]
 
     def bait_move(self):
         # Choose a move that we want them to copy so we can trap it
@@ -1,4 +1,6 @@
 import random
+from arena.markov import UNIFORM, mixed_policy
+from arena.moves import COUNTER, COUNTER_MOVE
 
 class NoiseCounterStrategy:
     name = "NoiseCounterStrategy"
@@ -17,8 +19,14 @@ class NoiseCounterStrategy:
         self.last_opponent_move = opponent_move
 
     def counter(self, move):
-        return {
-            "rock": "paper",
-            "paper": "scissors",
-            "scissors": "rock"
-        }[move]
+        return COUNTER_MOVE[move]
+
+    # State: the opponent's last move (None before the first round)
+    def markov_initial_state(self):
+        return None
+
+    def markov_policy(self, state):
+        return UNIFORM if state is None else mixed_policy(COUNTER[state], self.counter_prob)
+
+    def markov_next_state(self, state, own_move, opponent_move):
+        return opponent_move
@@ -1,4 +1,6 @@
 import random
+from arena.markov import UNIFORM, mixed_policy
+from arena.moves import COUNTER, COUNTER_MOVE
 
 
 class NoiseInjectionStrategy:
@@ -10,12 +12,8 @@ class NoiseInjectionStrategy:
         self.moves = ["rock", "paper", "scissors"]
 
     def _counter_move(self, move):
-        if move == "rock":
-            return "paper"
-        elif move == "paper":
-            return "scissors"
-        elif move == "scissors":
-            return "rock"
+        if move in COUNTER_MOVE:
+            return COUNTER_MOVE[move]
         return random.choice(self.moves)
 
     def play(self):
@@ -29,3 +27,14 @@ class NoiseInjectionStrategy:
 
     def handle_moves(self, own_move, opponent_move):
         pass  # This strategy is stateless
+
+    # State: its own last move (None before the first round)
+    def markov_initial_state(self):
+        return None
+
+    def markov_policy(self, state):
+        # Countering a uniformly random base move is itself uniform
+        return UNIFORM if state is None else mixed_policy(COUNTER[state], 1 - self.entropy)
+
+    def markov_next_state(self, state, own_move, opponent_move):
+        return own_move
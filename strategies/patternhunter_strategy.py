@@ -1,5 +1,6 @@
 from collections import Counter
 import random
+from arena.moves import COUNTER_MOVE
 
 class PatternHunterStrategy:
     name = "PatternHunterStrategy"
@@ -23,4 +24,4 @@ class PatternHunterStrategy:
             self.history.pop(0)
 
     def counter(self, move):
-        return {"rock": "paper", "paper": "scissors", "scissors": "rock"}[move]
+        return COUNTER_MOVE[move]
@@ -1,7 +1,51 @@
 import random
+import numpy as np
+from arena.batch import MOVE_CODES, PAYOFF_TABLE
+from arena.moves import SCORE_DELTA
+
+NO_STATE = 3  # row of the batched q-table used before the opponent has moved
+
+
+class QLearningStrategyBatch:
+    def __init__(self, rngs):
+        size = len(rngs)
+        self.rngs = rngs
+        self.q_table = np.zeros((size, 4, 3))
+        self.last_opponent_move = np.full(size, NO_STATE, dtype=np.int8)
+        self.last_action = np.zeros(size, dtype=np.int8)
+        self.games = np.arange(size)
+
+        self.learning_rate = 0.1
+        self.discount_factor = 0.9
+        self.epsilon = 0.1
+
+    def play_batch(self):
+        actions = self.q_table[self.games, self.last_opponent_move].argmax(axis=1).astype(np.int8)
+        for game, rng in enumerate(self.rngs):
+            if rng.random() < self.epsilon:
+                actions[game] = rng.choice(MOVE_CODES)
+        self.last_action = actions
+        return actions
+
+    def handle_moves_batch(self, own_moves, opponent_moves):
+        reward = PAYOFF_TABLE[own_moves, opponent_moves]
+        learn = self.last_opponent_move != NO_STATE
+        games = self.games[learn]
+        prev_state = self.last_opponent_move[learn]
+        action = self.last_action[learn]
+
+        next_best = self.q_table[games, opponent_moves[learn]].max(axis=1)
+        old_value = self.q_table[games, prev_state, action]
+        self.q_table[games, prev_state, action] += self.learning_rate * (
+            reward[learn] + self.discount_factor * next_best - old_value
+        )
+
+        self.last_opponent_move = opponent_moves.copy()
+
 
 class QLearningStrategy:
     name = "QLearningStrategy"
+    batch_class = QLearningStrategyBatch
 
     def __init__(self):
         self.q_table = {
@@ -45,13 +89,4 @@ class QLearningStrategy:
         self.last_opponent_move = opponent_move
 
     def get_reward(self, move1: str, move2: str) -> int:
-        if move1 == move2:
-            return 0
-        elif (
-            (move1 == "rock" and move2 == "scissors") or
-            (move1 == "scissors" and move2 == "paper") or
-            (move1 == "paper" and move2 == "rock")
-        ):
-            return 1
-        else:
-            return -1
+        return SCORE_DELTA[move1, move2]
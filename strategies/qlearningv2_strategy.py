@@ -2,6 +2,7 @@
 import random
 import math
 from collections import defaultdict, Counter
+from arena.moves import SCORE_DELTA
 
 class QLearningStrategyV2:
     name = "QLearningStrategy"
@@ -60,14 +61,7 @@ class QLearningStrategyV2:
         self.epsilon = max(0.01, self.epsilon * self.epsilon_decay)
 
     def get_result(self, move1, move2):
-        if move1 == move2:
-            return 0
-        elif (move1 == "rock" and move2 == "scissors") or \
-             (move1 == "scissors" and move2 == "paper") or \
-             (move1 == "paper" and move2 == "rock"):
-            return 1
-        else:
-            return -1
+        return SCORE_DELTA[move1, move2]
 
     def _ensure_state(self, state):
         if state not in self.q_table:
@@ -1,10 +1,21 @@
 import random
+from arena.markov import UNIFORM
 
 class RandomStrategy:
     name = "RandomStrategy"
+    int_moves = True
 
-    def play(self) -> str:
-        return random.choice(["rock", "paper", "scissors"])
+    def play(self) -> int:
+        return random.randrange(3)
 
-    def handle_moves(self, own_move: str, opponent_move: str):
+    def handle_moves(self, own_move: int, opponent_move: int):
         pass  # Doesn't adapt or learn
+
+    def markov_initial_state(self):
+        return None
+
+    def markov_policy(self, state):
+        return UNIFORM
+
+    def markov_next_state(self, state, own_move, opponent_move):
+        return None
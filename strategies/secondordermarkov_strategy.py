@@ -1,6 +1,7 @@
 import random
 import math
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, deque
+from arena.moves import COUNTER_MOVE
 
 class SecondOrderMarkov:
     name = "SecondOrderMarkov"
@@ -8,22 +9,18 @@ class SecondOrderMarkov:
     def __init__(self, order=2, alpha=0.2):
         self.order = order
         self.alpha = alpha
-        self.history = []
+        self.history = deque(maxlen=order)
         self.transition_probs = defaultdict(lambda: defaultdict(float))
 
     def counter_move(self, move):
-        if move == "rock":
-            return "paper"
-        elif move == "paper":
-            return "scissors"
-        elif move == "scissors":
-            return "rock"
+        if move in COUNTER_MOVE:
+            return COUNTER_MOVE[move]
         return random.choice(["rock", "paper", "scissors"])
 
     def play(self):
         if len(self.history) < self.order:
             return random.choice(["rock", "paper", "scissors"])
-        key = tuple(self.history[-self.order:])
+        key = tuple(self.history)
         next_probs = self.transition_probs.get(key, {})
         if not next_probs:
             return random.choice(["rock", "paper", "scissors"])
@@ -32,7 +29,7 @@ class SecondOrderMarkov:
 
     def handle_moves(self, own_move, opponent_move):
         if len(self.history) >= self.order:
-            key = tuple(self.history[-self.order:])
+            key = tuple(self.history)
             for move in ["rock", "paper", "scissors"]:
                 observed = 1.0 if move == opponent_move else 0.0
                 old = self.transition_probs[key][move]
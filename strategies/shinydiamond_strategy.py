@@ -4,6 +4,8 @@ from collections import defaultdict, Counter
 from strategies.secondordermarkov_strategy import SecondOrderMarkov
 from strategies.qlearningv2_strategy import QLearningStrategyV2
 from strategies.enhanceddelay_strategy import EnhancedStrategyDelay
+from arena.moves import SCORE_DELTA
+from arena.history import RingHistory
 
 
 class ShinyDiamond:
@@ -21,8 +23,10 @@ class ShinyDiamond:
         self.q_table = defaultdict(lambda: {a: 0.0 for a in self.actions})
         self.last_sa = None
 
-        self.opp_history = []
+        self.opp_history = RingHistory(maxlen=20)
         self.move_counts = Counter()
+        self.move_repeats = 0
+        self.move_transitions = 0
         self.strategy_scores = defaultdict(int)
         self.strategy_use = defaultdict(int)
         self.meta_state = None
@@ -108,10 +112,11 @@ class ShinyDiamond:
         return max(scores, key=scores.get)
 
     def classify_opponent(self):
-        if len(self.opp_history) < 20:
+        total = sum(self.move_counts.values())
+        if total < 20:
             return "unknown"
-        repeat_ratio = sum(self.opp_history[i] == self.opp_history[i-1] for i in range(1, len(self.opp_history))) / len(self.opp_history)
-        switch_ratio = sum(self.opp_history[i] != self.opp_history[i-1] for i in range(1, len(self.opp_history))) / len(self.opp_history)
+        repeat_ratio = self.move_repeats / total
+        switch_ratio = self.move_transitions / total
 
         if repeat_ratio > 0.6:
             return "repeater"
@@ -133,6 +138,10 @@ class ShinyDiamond:
             strat.handle_moves(my_move, opponent_move)
 
         # Track opponent history
+        if self.opp_history and opponent_move == self.opp_history[-1]:
+            self.move_repeats += 1
+        elif self.opp_history:
+            self.move_transitions += 1
         self.opp_history.append(opponent_move)
         self.move_counts[opponent_move] += 1
 
@@ -178,14 +187,7 @@ class ShinyDiamond:
         self.epsilon = max(0.01, self.epsilon * 0.995)
 
     def get_score_delta(self, move1, move2):
-        if move1 == move2:
-            return 0
-        elif (move1 == "rock" and move2 == "scissors") or \
-             (move1 == "scissors" and move2 == "paper") or \
-             (move1 == "paper" and move2 == "rock"):
-            return 1
-        else:
-            return -1
+        return SCORE_DELTA[move1, move2]
 
     def get_profiled_state(self):
         recent_repeat = int(len(self.opp_history) >= 2 and self.opp_history[-1] == self.opp_history[-2])
@@ -199,7 +201,7 @@ class ShinyDiamond:
                 bias_level = 2
             elif bias_ratio > 0.4:
                 bias_level = 1
-            switch_rate = sum(self.opp_history[i] != self.opp_history[i - 1] for i in range(1, len(self.opp_history))) / total
+            switch_rate = self.move_transitions / total
 
         switch_bucket = 2 if switch_rate > 0.6 else 1 if switch_rate > 0.3 else 0
         return (recent_repeat, bias_level, switch_bucket)
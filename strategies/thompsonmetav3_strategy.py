@@ -3,6 +3,8 @@ from collections import defaultdict
 from strategies.markov_strategy import MarkovStrategy
 from strategies.qlearning_strategy import QLearningStrategy
 from strategies.enhanced_strategy import EnhancedStrategy
+from arena.moves import SCORE_DELTA
+from arena.history import RingHistory
 
 class ThompsonMetaV3_Contextual:
     name = "ThompsonMetaV3_Contextual"
@@ -19,7 +21,7 @@ class ThompsonMetaV3_Contextual:
 
         self.last_used = None
         self.last_move = None
-        self.opp_history = []
+        self.opp_history = RingHistory(maxlen=3)
         self.decay_factor = 0.98
 
     def get_context(self):
@@ -65,13 +67,4 @@ class ThompsonMetaV3_Contextual:
         self.stats[(self.last_used, context)]["count"] += 1
 
     def get_score_delta(self, move1, move2):
-        if move1 == move2:
-            return 0
-        elif (
-            (move1 == "rock" and move2 == "scissors") or
-            (move1 == "scissors" and move2 == "paper") or
-            (move1 == "paper" and move2 == "rock")
-        ):
-            return 1
-        else:
-            return -1
+        return SCORE_DELTA[move1, move2]
@@ -4,6 +4,8 @@ from collections import defaultdict, Counter
 from strategies.markov_strategy import MarkovStrategy
 from strategies.qlearning_strategy import QLearningStrategy
 from strategies.enhanced_strategy import EnhancedStrategy
+from arena.moves import SCORE_DELTA
+from arena.history import RingHistory
 
 class ThompsonMetaV4_Profiled:
     name = "ThompsonMetaV4_Profiled"
@@ -23,7 +25,7 @@ class ThompsonMetaV4_Profiled:
         self.last_used = None
         self.last_move = None
 
-        self.opp_history = []
+        self.opp_history = RingHistory(maxlen=1)
         self.move_transitions = 0
         self.move_repeats = 0
         self.move_counts = Counter()
@@ -68,16 +70,7 @@ class ThompsonMetaV4_Profiled:
             self.stats[self.last_used]["losses"] += 1
 
     def get_result(self, move1, move2):
-        if move1 == move2:
-            return 0
-        elif (
-            (move1 == "rock" and move2 == "scissors") or
-            (move1 == "scissors" and move2 == "paper") or
-            (move1 == "paper" and move2 == "rock")
-        ):
-            return 1
-        else:
-            return -1
+        return SCORE_DELTA[move1, move2]
 
     def get_opponent_profile(self):
         total = sum(self.move_counts.values())
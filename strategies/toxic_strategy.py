@@ -1,5 +1,6 @@
 import random
 from collections import defaultdict, deque
+from arena.moves import COUNTER_MOVE
 
 class Toxic:
     name = "Toxic"
@@ -59,7 +60,7 @@ class Toxic:
         return (self.win_count / self.round_count) < self.reset_threshold
 
     def _counter_move(self, move):
-        return {"rock": "paper", "paper": "scissors", "scissors": "rock"}[move]
+        return COUNTER_MOVE[move]
 
     def play(self):
         if self._should_inject_noise():
@@ -0,0 +1,43 @@
+from fractions import Fraction
+
+from arena.game_engine import GameEngine
+from arena.markov import expected_counts
+from strategies.alwaysrock_strategy import AlwaysRockStrategy
+from strategies.noisecounter_strategy import NoiseCounterStrategy
+
+NUM_ROUNDS = 2000
+NUM_GAMES = 400
+
+
+def chain_expectation(num_rounds, counter_prob=Fraction(4, 5)):
+    # NoiseCounter vs AlwaysRock: a uniform first move, then paper with counter_prob plus a uniform third
+    # of the rest, so every later round is a win with 1 - 2q, a draw or a loss with q = (1 - counter_prob) / 3
+    q = (1 - counter_prob) / 3
+    later = num_rounds - 1
+    draws = Fraction(1, 3) + later * q
+    return draws, Fraction(1, 3) + later * (1 - 2 * q), draws
+
+
+def exact_engine():
+    engine = GameEngine()
+    engine.EXACT_MARKOV_GAMES = True
+    engine.NUM_PLAYS_PER_GAME = NUM_ROUNDS
+    engine.NUM_GAMES_PER_MATCH = NUM_GAMES
+    engine.EARLY_STOP_TOLERANCE = 0.0
+    engine.SANDBOX_STRATEGIES = False
+    return engine
+
+
+def test_expected_counts_match_chain():
+    counts = expected_counts(NoiseCounterStrategy(), AlwaysRockStrategy(), NUM_ROUNDS)
+    for count, expected in zip(counts, chain_expectation(NUM_ROUNDS)):
+        assert abs(count - float(expected)) < 1e-6
+
+
+def test_matchup_totals_are_the_rounded_exact_sums():
+    totals = exact_engine().play_matchup(NoiseCounterStrategy, AlwaysRockStrategy)
+    draws, wins1, wins2 = (round(NUM_GAMES * count) for count in chain_expectation(NUM_ROUNDS))
+    assert totals["games"] == NUM_GAMES
+    assert totals["wins"] == (wins1, wins2)
+    assert totals["draws"] == draws
+    assert all(isinstance(count, int) for count in (*totals["wins"], totals["draws"]))
@@ -11,6 +11,8 @@ import seaborn as sns
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from main import GameEngine
+from arena.events import SilentReporter
+from arena.stats import TournamentStats
 from strategies.random_strategy import RandomStrategy
 from strategies.enhanced_strategy import EnhancedStrategy
 from strategies.copycat_strategy import CopycatStrategy
@@ -103,7 +105,7 @@ strategy_descriptions = {
     "EntropyMaximizerStrategy": "Aims to maximize uncertainty for the opponent by making moves harder to model.",
     "PatternHunterStrategy": "Detects short-term patterns in opponent’s behavior and counters them directly.",
     "AdaptiveSwitcherStrategy": "Switches between strategies mid-game based on performance metrics.",
-    "BayesianNGramStrategy": "Predicts the opponent’s next move based on recent move sequences using Bayesian inference with smoothing and decay for adaptive pattern recognition."",
+    "BayesianNGramStrategy": "Predicts the opponent’s next move based on recent move sequences using Bayesian inference with smoothing and decay for adaptive pattern recognition.",
     "ThompsonMetaStrategy": "Uses classic Thompson Sampling to dynamically choose between sub-strategies based on their win/loss records. Balances exploration and exploitation by sampling from a Beta distribution. Adapts to unknown or changing opponents over time.",
     "ThompsonMetaV2": "Enhances Thompson Sampling by using score-based rewards (+1/-1/0) instead of binary outcomes. Applies exponential decay to past results, allowing the strategy to remain responsive to recent opponent behavior while discounting outdated performance.",
     "ThompsonMetaV3_Contextual": "Introduces lightweight contextual inference by segmenting opponent behavior into patterns (e.g., last 3 moves). Maintains separate Thompson statistics for each context to select strategies more intelligently based on the opponent's current play style.",
@@ -172,9 +174,18 @@ if run_arena and len(selected_strategies) >= 2:
 
     strategy_classes = [strategy_map[name] for name in selected_strategies]
 
-    with st.spinner("Running tournament..."):
-        results = engine.round_robin_tournament(strategy_classes)
-
+    # Stream matchups so the progress bar moves as each one finishes
+    stats = TournamentStats(engine.NUM_GAMES_PER_MATCH)
+    total_matchups = len(strategy_classes) * (len(strategy_classes) - 1) // 2
+    progress = st.progress(0.0, text="Running tournament...")
+    metrics = []
+    for result in engine.iter_tournament(strategy_classes, stats=stats, reporter=SilentReporter()):
+        metrics.append(result)
+        s1, s2 = result["strategies"]
+        progress.progress(len(metrics) / total_matchups, text=f"{s1} vs {s2} ({len(metrics)}/{total_matchups})")
+    progress.empty()
+
+    results = {"score_stats": stats.score_stats(), "metrics": metrics}
     score_stats = results["score_stats"]
 
    # Replace the score_df creation block with this: